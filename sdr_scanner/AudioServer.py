@@ -1,6 +1,7 @@
 import asyncio
 import collections
-from multiprocessing import shared_memory, Process, Value
+from multiprocessing import shared_memory, Event, Process
+from multiprocessing.synchronize import Event as EventType
 import numpy as np
 import os
 import socket
@@ -35,6 +36,12 @@ class AudioServerConfig(object):
     """
     Ran in the Supervisor process, builds the ShmBuffers to give to the AudioServer process and Receiver Senders
     """
+
+    # One mono float32 sample per slot, so the buffer holds 2 * MAX_STALL_S = 1 second of audio. Sized per
+    # HighPerformanceCircularBuffer.create(), twice the worst AudioServer stall, before the Receiver Senders block
+    MAX_STALL_S = 0.5
+    INPUT_BUFFER_LEN = int(2 * AUDIO_SAMPLERATE * MAX_STALL_S)
+
     def __init__(self, numInputStreams: int, outputConfigDicts: List[Dict[Any, Any]]):
         self._numInputStreams = numInputStreams
 
@@ -42,26 +49,20 @@ class AudioServerConfig(object):
         # Shared Memory Input Buffers
 
         self.inputStreamShmBuffers: List[shared_memory.SharedMemory] = []
-        self.inputStreamHeadIdxs: List[Any] = []
-        self.inputStreamTailIdxs: List[Any] = []
+        self.inputStreamNotFullEvents: List[EventType] = []
 
         for i in range(0, numInputStreams):
-            self.inputStreamShmBuffers.append(shared_memory.SharedMemory(
-                create=True,
-                size=AUDIO_SAMPLERATE,  # means we effectively have a 0.25 second buffer
-            ))
-            self.inputStreamHeadIdxs.append(Value('i', lock=False))
-            self.inputStreamHeadIdxs[i].value = 0
-            self.inputStreamTailIdxs.append(Value('i', lock=False))
-            self.inputStreamTailIdxs[i].value = 0
-        
+            notFullEvent = Event()
+            circularBuffer = HighPerformanceCircularBuffer.create(self.INPUT_BUFFER_LEN, np.dtype('float32'), notFullEvent)
+            self.inputStreamShmBuffers.append(circularBuffer.shmBuffer)
+            self.inputStreamNotFullEvents.append(notFullEvent)
+
         self._outputConfigDicts = outputConfigDicts
 
-    def getInputShmBuffers(self, inputStreamIdx: int) -> Tuple[shared_memory.SharedMemory, Any, Any]:
+    def getInputShmBuffers(self, inputStreamIdx: int) -> Tuple[shared_memory.SharedMemory, EventType]:
         return (
             self.inputStreamShmBuffers[inputStreamIdx],
-            self.inputStreamHeadIdxs[inputStreamIdx],
-            self.inputStreamTailIdxs[inputStreamIdx],
+            self.inputStreamNotFullEvents[inputStreamIdx],
         )
 
     def getProcess(self):
@@ -69,8 +70,7 @@ class AudioServerConfig(object):
             target=AudioServer.runAsProcess, args=(
                 self._numInputStreams,
                 self.inputStreamShmBuffers,
-                self.inputStreamHeadIdxs,
-                self.inputStreamTailIdxs,
+                self.inputStreamNotFullEvents,
                 self._outputConfigDicts,
             )
         )
@@ -103,16 +103,15 @@ class AudioSender(object):
     """
     Send an audioStream to a shared buffer
     """
-    def __init__(self, audioShmBuffer: shared_memory.SharedMemory, headIdx: Any, tailIdx: Any):
+    def __init__(self, audioShmBuffer: shared_memory.SharedMemory, notFullEvent: EventType):
 
         self.audioCircularBuffer = HighPerformanceCircularBuffer(
             shmBuffer=audioShmBuffer,
             itemDtype=np.dtype('float32'),
-            headPointer=headIdx,
-            tailPointer=tailIdx,
+            notFullEvent=notFullEvent,
         )
 
-    def write(self, samples: List[float]) -> int:
+    def write(self, samples: np.ndarray) -> int:
         """
         returns the number successfully written
         """
@@ -139,6 +138,63 @@ class AudioSender_grEmbeddedPythonBlock(gr.sync_block):
         return numWrote
 
 
+class MixBuffer(object):
+    """
+    Ring of one input stream's float32 samples waiting to be mixed. Filled straight from the ShmBuffer with
+    read_into(), and mixed out with numpy slices - no per sample Python objects.
+
+    The read / write cursors count up, the slot is cursor % size.
+    """
+    def __init__(self, size: int) -> None:
+        self._buf: np.ndarray = np.zeros(size, dtype=np.float32)
+        self._size = size
+        self._readIdx = 0
+        self._writeIdx = 0
+
+    def __len__(self) -> int:
+        return self._writeIdx - self._readIdx
+
+    def fill(self, circularBuffer: HighPerformanceCircularBuffer) -> int:
+        """
+        Read what's available, up to the free space - returns the number of samples read
+        """
+        numRead = 0
+        while self._writeIdx - self._readIdx < self._size:
+            writePos = self._writeIdx % self._size
+            readPos = self._readIdx % self._size
+            # Free space is contiguous up to the read position, or to the end of the buffer if that's behind us
+            if writePos < readPos:
+                n = circularBuffer.read_into(self._buf[:readPos], writePos)
+            else:
+                n = circularBuffer.read_into(self._buf, writePos)
+            if not n:
+                break
+            self._writeIdx += n
+            numRead += n
+            # Only go round again if the read stopped at the end of the buffer
+            if (writePos + n) % self._size:
+                break
+        return numRead
+
+    def mixInto(self, out: np.ndarray) -> None:
+        """
+        Add the oldest samples to out, consuming up to len(out) of them
+        """
+        numSamples = min(self._writeIdx - self._readIdx, len(out))
+        readPos = self._readIdx % self._size
+        firstLen = min(numSamples, self._size - readPos)
+        out[:firstLen] += self._buf[readPos:readPos + firstLen]
+        if numSamples > firstLen:
+            out[firstLen:numSamples] += self._buf[:numSamples - firstLen]
+        self._readIdx += numSamples
+
+    def discard(self, numSamples: int) -> None:
+        """
+        Drop the oldest numSamples
+        """
+        self._readIdx += min(numSamples, self._writeIdx - self._readIdx)
+
+
 class AudioServer(object):
     """
     Stand-alone process, receives audio streams from Receivers, mixes them down.
@@ -152,22 +208,18 @@ class AudioServer(object):
             self,
             numInputStreams: int,
             inputStreamShmBuffers: List[shared_memory.SharedMemory],
-            inputStreamHeadIdxs: List[Any],
-            inputStreamTailIdxs: List[Any],
+            inputStreamNotFullEvents: List[EventType],
             outputConfigDicts: List[Dict[Any, Any]],
         ) -> None:
         self._numInputStreams = numInputStreams
         self.inputStreamShmBuffers = inputStreamShmBuffers
-        self.inputStreamHeadIdxs = inputStreamHeadIdxs
-        self.inputStreamTailIdxs = inputStreamTailIdxs
 
         self.inputStreamCircularBuffers: List[HighPerformanceCircularBuffer] = []
         for i in range(0, numInputStreams):
             self.inputStreamCircularBuffers.append(HighPerformanceCircularBuffer(
                 shmBuffer=self.inputStreamShmBuffers[i],
                 itemDtype=np.dtype('float32'),
-                headPointer=self.inputStreamHeadIdxs[i],
-                tailPointer=self.inputStreamTailIdxs[i],
+                notFullEvent=inputStreamNotFullEvents[i],
             ))
 
         self._outputs: List[AudioServerOutput_Base] = []
@@ -186,9 +238,13 @@ class AudioServer(object):
     def run(self) -> None:
         print("Audio Server Running")
 
-        mixBuffers: List[collections.deque] = []
+        mixBuffers: List[MixBuffer] = []
         for i in range(0, self._numInputStreams):
-            mixBuffers.append( collections.deque(maxlen=self.BUFFER_LEN) )
+            mixBuffers.append(MixBuffer(self.BUFFER_LEN))
+
+        # Reused for every mix, grown if a stall leaves more samples to mix than fit
+        mixOut: np.ndarray = np.zeros(self.BUFFER_LEN, dtype=np.float32)
+        shortOut: np.ndarray = np.zeros(self.BUFFER_LEN, dtype=np.int16)
 
         for o in self._outputs:
             o.reconnect()
@@ -207,42 +263,34 @@ class AudioServer(object):
         while not self._stopFlag:
             # Read ShmBuffers
             for i in range(0, self._numInputStreams):
-                inBuf: List[float] = []
-                numRead = self.inputStreamCircularBuffers[i].read(inBuf)
-                if numRead:
-                    mixBuffers[i].extend(inBuf)
-            # print("")
+                mixBuffers[i].fill(self.inputStreamCircularBuffers[i])
 
             # Mix Audio
             curTime = time.time()
             samplesToMix = int((curTime - startTime) * AUDIO_SAMPLERATE) - samplesMixed
-            newSamples: List[int] = []
-            for _ in range(0, samplesToMix):
-                outSum = 0.0
-                for i in range(0, self._numInputStreams):
-                    buf = mixBuffers[i]
-                    lenBuf = len(buf)
-                    if lenBuf > 0:
-                        outSum += buf.popleft()
-
-                # convert to short
-                i_out = int(outSum * 32767.0)
-                if i_out > 32767:
-                    i_out = 32767
-                elif i_out < -32767:
-                    i_out = -32767
-
-                newSamples.append(i_out)
+            # time.time() can step back, then there's nothing to mix until it catches up
+            numOut = max(samplesToMix, 0)
+            if numOut > len(mixOut):
+                mixOut = np.zeros(numOut, dtype=np.float32)
+                shortOut = np.zeros(numOut, dtype=np.int16)
+            mixed = mixOut[:numOut]
+            mixed.fill(0.0)
+            for buf in mixBuffers:
+                buf.mixInto(mixed)
+
+            # convert to short - the float to int cast truncates toward zero, like int()
+            mixed *= 32767.0
+            np.clip(mixed, -32767.0, 32767.0, out=mixed)
+            shortOut[:numOut] = mixed
+            # The outputs buffer plain ints
+            newSamples: List[int] = shortOut[:numOut].tolist()
             samplesMixed += samplesToMix
 
-            for i in range(0, self._numInputStreams):
-                buf = mixBuffers[i]
+            for buf in mixBuffers:
                 lenBuf = len(buf)
                 if lenBuf > self.BUFFER_TARGET_LEN:
                     print(f"AudioServer - mixBuf - Discarding {lenBuf - self.BUFFER_TARGET_LEN} samples")
-                    for _ in range(0, lenBuf - self.BUFFER_TARGET_LEN):
-                        buf.popleft()
-
+                    buf.discard(lenBuf - self.BUFFER_TARGET_LEN)
 
             # Send to outputs
             for o in self._outputs:
@@ -259,11 +307,10 @@ class AudioServer(object):
         cls,
         numInputStreams: int,
         inputStreamShmBuffers: List[shared_memory.SharedMemory],
-        inputStreamHeadIdxs: List[Any],
-        inputStreamTailIdxs: List[Any],
+        inputStreamNotFullEvents: List[EventType],
         outputConfigDicts: List[Dict[Any, Any]],
     ) -> None:
-        audioServer = cls(numInputStreams, inputStreamShmBuffers, inputStreamHeadIdxs, inputStreamTailIdxs, outputConfigDicts)
+        audioServer = cls(numInputStreams, inputStreamShmBuffers, inputStreamNotFullEvents, outputConfigDicts)
         audioServer.run()
 
 
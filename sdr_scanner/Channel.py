@@ -120,6 +120,15 @@ class MagToPowerLowPass_EmbeddedPythonBlock(gr.sync_block):
 
 
 class ChannelConfig():
+
+    # Fixed attribute set - smaller instances and faster attribute access for the per row UI lookups
+    __slots__ = (
+        'id', 'freq_hz', 'label', 'mode',
+        'dwellTime_s', 'audioGain_dB', 'squelchThreshold',
+        '_enabled', '_disableUntil', 'mute', 'solo', 'hold', 'forceActive',
+        '_freqLabel', '_freqLabelHz',
+    )
+
     def __init__(self, freq_hz: int, label: str, mode: ChannelMode=ChannelMode.FM, audioGain_dB: float=0, dwellTime_s: float=3.0, squelchThreshold:float=-55.0, mute:bool=False, solo:Optional[bool]=None, hold:bool=False):
 
         self.id = str(uuid.uuid4())
@@ -139,6 +148,18 @@ class ChannelConfig():
         self.hold = hold
         self.forceActive = False
 
+        self._freqLabel = ""
+        self._freqLabelHz: Optional[float] = None
+
+    def getFreqLabel(self) -> str:
+        """
+        Freq in MHz for display, cached until freq_hz changes
+        """
+        if self._freqLabelHz != self.freq_hz:
+            self._freqLabel = f"{self.freq_hz / 1e6:6.3f}"
+            self._freqLabelHz = self.freq_hz
+        return self._freqLabel
+
     def enable(self, enable: bool=True):
         self._disableUntil = None
         self._enabled = enable
@@ -172,7 +193,7 @@ class ChannelConfig():
         self.forceActive = forceActive
 
     def debugPrint(self):
-        print(f"    {self.freq_hz / 1e6:6.3f} {self.mode.name} {self.label}")
+        print(f"    {self.getFreqLabel()} {self.mode.name} {self.label}")
 
     @staticmethod
     def modeStrLookup(modeStr: str) -> Optional[ChannelMode]:
@@ -269,6 +290,8 @@ class Channel():
         self._solo = solo
         self._hold = hold
         self._forceActive = forceActive
+        self._enabled = True
+        self._disabledStatusSent = False
 
         self.hardwareFreq_hz = hardwareFreq_hz
 
@@ -358,12 +381,23 @@ class Channel():
         )
         return channel
 
-    def getStatus(self, statusPipe):
-        return self.channelBlock.getStatus(statusPipe)
+    def getStatus(self, statusSender):
+        if not self._enabled:
+            # Disabled in place - report IDLE once so the UI clears, and never hold the window
+            if statusSender and not self._disabledStatusSent:
+                statusSender.sendChannelStatus(self.id, ChannelStatus.IDLE, None, None, None)
+                self._disabledStatusSent = True
+            return ChannelStatus.IDLE
+        return self.channelBlock.getStatus(statusSender)
 
     def getMinimumScanTime(self):
         return self.channelBlock.getMinimumScanTime()
 
+    def setEnabled(self, enable: bool):
+        self._enabled = enable
+        self._disabledStatusSent = False
+        self.channelBlock.setEnabled(enable)
+
     def setMute(self, mute):
         self._mute = mute
         self.channelBlock.setMute(mute)
@@ -410,6 +444,7 @@ class ChannelBlock_Base(gr.hier_block2):
         self._solo = solo
         self._hold = hold
         self._forceActive = False
+        self._enabled = True
         self.squelchThreshold = squelchThreshold
         self.audioGainFactor = dbToRatio(audioGain_dB) * self.FIXED_AUDIO_GAIN_FACTOR
         self._dwellTime_s = dwellTime_s
@@ -468,13 +503,17 @@ class ChannelBlock_Base(gr.hier_block2):
     def setMute(self, mute: bool=True):
         self._mute = mute
 
-        finalMute = self._mute
+        finalMute = self._mute or not self._enabled
         if self._solo is not None:
             if not self._solo:
                 finalMute = True
 
         self.blockAudioMute.set_mute(finalMute)
 
+    def setEnabled(self, enable: bool):
+        self._enabled = enable
+        self.setMute(self._mute)
+
     def setSolo(self, solo: Optional[bool]):
         self._solo = solo
         self.setMute(self._mute)
@@ -662,7 +701,7 @@ class ChannelBlock_FM(ChannelBlock_Base):
         self.squelchThreshold = squelchThreshold
         self.blockAnalogPowerSquelch.set_threshold(squelchThreshold)
 
-    def getStatus(self, statusPipe):
+    def getStatus(self, statusSender):
         status = ChannelStatus.HOLD if self._hold else ChannelStatus.IDLE
         if self.blockAnalogPowerSquelch.unmuted():
             self._active = True
@@ -679,17 +718,14 @@ class ChannelBlock_FM(ChannelBlock_Base):
         if status != self._lastStatusReport or (status != ChannelStatus.IDLE and (time.time() - self._lastStatusTime) > STATUS_UPDATE_TIME_S):
             self._lastStatusTime = time.time()
             self._lastStatusReport = status
-            if statusPipe:
-                statusPipe.send([{
-                    'type': 'channel_status',
-                    'data': {
-                        'id': self.channelId,
-                        'status': status,
-                         'rssi': self._rssi,
-                         'noiseFloor': self._noiseFloor_dBFS,
-                         'volume': self._volume_dBFS,
-                    }
-                }])
+            if statusSender:
+                statusSender.sendChannelStatus(
+                    self.channelId,
+                    status,
+                    self._rssi,
+                    self._noiseFloor_dBFS,
+                    self._volume_dBFS,
+                )
 
         return status
 
@@ -858,7 +894,7 @@ class ChannelBlock_AM(ChannelBlock_Base):
         self.squelchThreshold = squelchThreshold
         self.blockAnalogPowerSquelch.set_threshold(squelchThreshold)
 
-    def getStatus(self, statusPipe):
+    def getStatus(self, statusSender):
         status = ChannelStatus.HOLD if self._hold else ChannelStatus.IDLE
         if self.blockAnalogPowerSquelch.unmuted():
             self._active = True
@@ -876,17 +912,14 @@ class ChannelBlock_AM(ChannelBlock_Base):
         if status != self._lastStatusReport or (status != ChannelStatus.IDLE and (time.time() - self._lastStatusTime) > STATUS_UPDATE_TIME_S):
             self._lastStatusTime = time.time()
             self._lastStatusReport = status
-            if statusPipe:
-                statusPipe.send([{
-                    'type': 'channel_status',
-                    'data': {
-                        'id': self.channelId,
-                        'status': status,
-                        'rssi': self._rssi,
-                        'noiseFloor': self._noiseFloor_dBFS,
-                        'volume': self._volume_dBFS,
-                    }
-                }])
+            if statusSender:
+                statusSender.sendChannelStatus(
+                    self.channelId,
+                    status,
+                    self._rssi,
+                    self._noiseFloor_dBFS,
+                    self._volume_dBFS,
+                )
 
         return status
 
@@ -1059,7 +1092,7 @@ class ChannelBlock_EAS(ChannelBlock_Base):
         else:
             self._triggerCount = 0
 
-    def getStatus(self, statusPipe):
+    def getStatus(self, statusSender):
         status = ChannelStatus.HOLD if self._hold else ChannelStatus.IDLE
         if self._active or self._forceActive:
             self._active = True
@@ -1077,17 +1110,14 @@ class ChannelBlock_EAS(ChannelBlock_Base):
         if status != self._lastStatusReport or (status != ChannelStatus.IDLE and (time.time() - self._lastStatusTime) > STATUS_UPDATE_TIME_S):
             self._lastStatusTime = time.time()
             self._lastStatusReport = status
-            if statusPipe:
-                statusPipe.send([{
-                    'type': 'channel_status',
-                    'data': {
-                        'id': self.channelId,
-                        'status': status,
-                        'rssi': self.blockFM._rssi,
-                        'noiseFloor': self.blockFM._noiseFloor_dBFS,
-                        'volume': self.blockFM._volume_dBFS,
-                    }
-                }])
+            if statusSender:
+                statusSender.sendChannelStatus(
+                    self.channelId,
+                    status,
+                    self.blockFM._rssi,
+                    self.blockFM._noiseFloor_dBFS,
+                    self.blockFM._volume_dBFS,
+                )
 
         return status
 
@@ -1314,7 +1344,7 @@ class ChannelBlock_SSB(ChannelBlock_Base):
         self.squelchThreshold = squelchThreshold
         self.blockAnalogPowerSquelch.set_threshold(squelchThreshold)
 
-    def getStatus(self, statusPipe):
+    def getStatus(self, statusSender):
         status = ChannelStatus.HOLD if self._hold else ChannelStatus.IDLE
         if self.blockAnalogPowerSquelch.unmuted():
             self._active = True
@@ -1331,17 +1361,14 @@ class ChannelBlock_SSB(ChannelBlock_Base):
         if status != self._lastStatusReport or (status != ChannelStatus.IDLE and (time.time() - self._lastStatusTime) > STATUS_UPDATE_TIME_S):
             self._lastStatusTime = time.time()
             self._lastStatusReport = status
-            if statusPipe:
-                statusPipe.send([{
-                    'type': 'channel_status',
-                    'data': {
-                        'id': self.channelId,
-                        'status': status,
-                        'rssi': self._rssi,
-                        'noiseFloor': self._noiseFloor_dBFS,
-                        'volume': self._volume_dBFS,
-                    }
-                }])
+            if statusSender:
+                statusSender.sendChannelStatus(
+                    self.channelId,
+                    status,
+                    self._rssi,
+                    self._noiseFloor_dBFS,
+                    self._volume_dBFS,
+                )
 
         return status
 
@@ -16,6 +16,7 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Response
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import FileResponse, JSONResponse
 
+from .RingBuffer import drainQueue
 from .Scanner import Scanner
 
 # Control Message Types we won't send via Websocket
@@ -24,6 +25,10 @@ SCANNER_IGNORE_MESSAGE_TYPES = [
     "ScanWindowDone",
 ]
 
+# Print every message received over the Websocket - formatting and writing to stdout on the event loop for each
+# message stalls the broadcasts to the other clients, so only for debugging
+DEBUG_WS_MESSAGES = False
+
 
 def ws_json(obj: Any) -> str:
     # Convert into JSON-safe primitives
@@ -77,12 +82,18 @@ class ScannerWeb:
             except queue.Empty:
                 continue
 
-            msgType = msg.get("type")
-            if msgType in SCANNER_IGNORE_MESSAGE_TYPES:
-                continue
+            # Block for the first message only, then take the rest of the backlog under one lock
+            msgs = drainQueue(self.scanner_to_ui)
+            msgs.appendleft(msg)
+            self.scanner_to_ui.task_done()
+
+            for msg in msgs:
+                msgType = msg.get("type")
+                if msgType in SCANNER_IGNORE_MESSAGE_TYPES:
+                    continue
 
-            # Broadcast to clients
-            self._emit_to_asyncio(msg)
+                # Broadcast to clients
+                self._emit_to_asyncio(msg)
 
 
 def create_app(
@@ -140,7 +151,8 @@ def create_app(
 
             while True:
                 raw = await ws.receive_text()
-                print(f"WS RAW: {raw}")
+                if DEBUG_WS_MESSAGES:
+                    print(f"WS RAW: {raw}")
 
                 try:
                     msg = json.loads(raw)
@@ -152,7 +164,8 @@ def create_app(
                 if isinstance(msg, dict) and "type" in msg:
                     mtype = str(msg.get("type") or "")
 
-                    print(f"WEB->SCANNER: {msg}")
+                    if DEBUG_WS_MESSAGES:
+                        print(f"WEB->SCANNER: {msg}")
                     bridge.ui_to_scanner.put(msg)
 
         except WebSocketDisconnect:
@@ -4,9 +4,14 @@ os.environ['SOAPY_SDR_LOG_LEVEL'] = 'WARNING'
 
 import contextlib
 from enum import IntEnum
+import math
 from multiprocessing import shared_memory
+from multiprocessing.synchronize import Event as EventType
+import numpy
+import pickle
+import struct
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
 from gnuradio import audio
@@ -17,6 +22,7 @@ from .const import AUDIO_SAMPLERATE, BFM_QUAD_RATE, FM_QUAD_RATE, MAX_RF_SAMPLER
 from .AudioServer import AudioSender, AudioSender_grEmbeddedPythonBlock
 from .Channel import Channel
 from .ScanWindow import ScanWindow, ScanWindowConfig
+from .hpSharedMem import HighPerformanceCircularBuffer
 
 
 class ReceiverType(IntEnum):
@@ -32,6 +38,34 @@ class ReceiverStatus(IntEnum):
     FAILED = 3
 
 
+class ReceiverRecordType(IntEnum):
+    CHANNEL_STATUS = 1
+    WINDOW_DONE = 2
+
+
+# Fixed-width records sent from the Receiver to the Scanner through a HighPerformanceCircularBuffer.
+# Windows / Channels are referenced by their index in the synced config (the Scanner's scanWindowConfigs
+# and each ScanWindowConfig's channelConfigs), None values are sent as NaN.
+RECEIVER_RECORD_DTYPE = numpy.dtype([
+    ('type', 'u1'),
+    ('status', 'u1'),
+    ('windowIdx', 'u4'),
+    ('channelIdx', 'u4'),
+    ('rssi', 'f4'),
+    ('noiseFloor', 'f4'),
+    ('volume', 'f4'),
+])
+
+RECEIVER_RECORD_BUFFER_LEN = 1024
+
+###
+# Binary Pipe messages (Connection.send_bytes) for the hot Scanner --> RX messages, first byte is the tag.
+# Pickled messages start with the pickle PROTO opcode (0x80), so both can share the Pipe.
+
+PIPE_MSG_SCAN_WINDOW = 0x01  # + u4 window index, in configured order
+PIPE_MSG_SCAN_WINDOW_STRUCT = struct.Struct('<BI')
+
+
 class ReceiverBlock(gr.top_block):
 
     def __init__(self, receiverArgs) -> None:
@@ -64,13 +98,13 @@ class ReceiverBlock(gr.top_block):
         self.wait()
         self.status = ReceiverStatus.IDLE
 
-    def checkWindow(self, statusPipe) -> bool:
+    def checkWindow(self, statusSender) -> bool:
         """
         return True if the Window is active, False if it is done and stopped
         """
         if not self._scanWindow:
             return False
-        if not self._scanWindow.isActive(statusPipe) and time.time() > self._windowTimeout:
+        if not self._scanWindow.isActive(statusSender) and time.time() > self._windowTimeout:
             self.stopWindow()
             self.status = ReceiverStatus.WINDOW_COMPLETE
             return False
@@ -288,6 +322,65 @@ class Receiver():
     def getScanWindow(self, swId) -> ScanWindow:
         return self._scanWindowsById[swId]
 
+    def getScanWindows(self) -> List[ScanWindow]:
+        """
+        ScanWindows in the order they were configured
+        """
+        return list(self._scanWindowsById.values())
+
+
+class ReceiverStatusSender():
+    """
+    Send channel_status / window_done records to the Scanner through a shared buffer, avoiding
+    the pickling overhead of sending them through the Pipe.
+    """
+    def __init__(self, statusShmBuffer: shared_memory.SharedMemory, notFullEvent: EventType):
+
+        self.statusCircularBuffer = HighPerformanceCircularBuffer(
+            shmBuffer=statusShmBuffer,
+            itemDtype=RECEIVER_RECORD_DTYPE,
+            notFullEvent=notFullEvent,
+        )
+
+        self._record = numpy.zeros(1, dtype=RECEIVER_RECORD_DTYPE)
+
+        self._windowIdxById: Dict[Any, int] = {}
+        self._channelIdxsById: Dict[Any, Tuple[int, int]] = {}
+
+    def setScanWindows(self, scanWindows: List[ScanWindow]) -> None:
+        """
+        Build the id -> index lookups, scanWindows must be in the order of the synced config
+        """
+        self._windowIdxById = {}
+        self._channelIdxsById = {}
+        for windowIdx, sw in enumerate(scanWindows):
+            self._windowIdxById[sw.id] = windowIdx
+            for channelIdx, channel in enumerate(sw.channels):
+                self._channelIdxsById[channel.id] = (windowIdx, channelIdx)
+
+    def sendChannelStatus(self, channelId, status, rssi: Optional[float], noiseFloor: Optional[float], volume: Optional[float]) -> None:
+        windowIdx, channelIdx = self._channelIdxsById[channelId]
+        record = self._record[0]
+        record['type'] = ReceiverRecordType.CHANNEL_STATUS
+        record['status'] = status
+        record['windowIdx'] = windowIdx
+        record['channelIdx'] = channelIdx
+        record['rssi'] = math.nan if rssi is None else rssi
+        record['noiseFloor'] = math.nan if noiseFloor is None else noiseFloor
+        record['volume'] = math.nan if volume is None else volume
+        self.statusCircularBuffer.write(self._record)
+
+    def sendWindowDone(self, windowId) -> None:
+        record = self._record[0]
+        record['type'] = ReceiverRecordType.WINDOW_DONE
+        record['status'] = 0
+        record['windowIdx'] = self._windowIdxById[windowId]
+        record['channelIdx'] = 0
+        record['rssi'] = math.nan
+        record['noiseFloor'] = math.nan
+        record['volume'] = math.nan
+        self.statusCircularBuffer.write(self._record)
+
 
 class ReceiverConfig():
 
@@ -316,13 +409,27 @@ class ReceiverConfig():
         self._scanWindowsById: Dict[Any, ScanWindow] = {}
 
 
-def runAsProcess(pipe, receiverConfig: ReceiverConfig, audioShmBuffer: shared_memory.SharedMemory, headIdx: Any, tailIdx: Any):
+def runAsProcess(
+        pipe,
+        receiverConfig: ReceiverConfig,
+        statusShmBuffer: shared_memory.SharedMemory,
+        statusNotFullEvent: EventType,
+        audioShmBuffer: shared_memory.SharedMemory,
+        audioNotFullEvent: EventType,
+    ):
 
 #    with contextlib.redirect_stderr(None):
 #        with contextlib.redirect_stdout(None):
-            _runAsProcess(pipe, receiverConfig, audioShmBuffer, headIdx, tailIdx)
+            _runAsProcess(pipe, receiverConfig, statusShmBuffer, statusNotFullEvent, audioShmBuffer, audioNotFullEvent)
 
-def _runAsProcess(pipe, receiverConfig: ReceiverConfig, audioShmBuffer: shared_memory.SharedMemory, headIdx: Any, tailIdx: Any):
+def _runAsProcess(
+        pipe,
+        receiverConfig: ReceiverConfig,
+        statusShmBuffer: shared_memory.SharedMemory,
+        statusNotFullEvent: EventType,
+        audioShmBuffer: shared_memory.SharedMemory,
+        audioNotFullEvent: EventType,
+    ):
 
     rx = Receiver(receiverConfig.id, receiverConfig.rxType, receiverConfig.receiverArgs)
     rxBlock = rx.getReceiverBlock()
@@ -330,11 +437,14 @@ def _runAsProcess(pipe, receiverConfig: ReceiverConfig, audioShmBuffer: shared_m
     # On startup, send back our Receiver SampleRates
     pipe.send([{'type': 'sample_rates', 'data': rxBlock.getSampleRates()}])
 
+    # channel_status / window_done are sent through the shared status buffer
+    statusSender = ReceiverStatusSender(statusShmBuffer, statusNotFullEvent)
 
     # blockAudioSink = audio.sink(AUDIO_SAMPLERATE, '', True)
-    audioSender = AudioSender(audioShmBuffer, headIdx, tailIdx)
+    audioSender = AudioSender(audioShmBuffer, audioNotFullEvent)
     blockAudioSink = AudioSender_grEmbeddedPythonBlock(audioSender)
 
+    scanWindows: List[ScanWindow] = []
     runningWindow = None
     while True:
 
@@ -342,26 +452,29 @@ def _runAsProcess(pipe, receiverConfig: ReceiverConfig, audioShmBuffer: shared_m
         # Check for commands
 
         if pipe.poll():
-            packet = pipe.recv()
+            buf = pipe.recv_bytes()
+            tag = buf[0]
+            packet = []
+            if tag == PIPE_MSG_SCAN_WINDOW:
+                _, windowIdx = PIPE_MSG_SCAN_WINDOW_STRUCT.unpack(buf)
+                scanWindow = scanWindows[windowIdx]
+                runningWindow = scanWindow
+                if rxBlock.status != ReceiverStatus.IDLE:
+                    raise Exception(f"Received new Scan Window {scanWindow.id} while not IDLE")
+                #print(f"Scanning window {scanWindow.id} on {str(rxBlock)}")
+                rxBlock.setupWindow(scanWindow, blockAudioSink)
+                rxBlock.startWindow()
+            else:
+                packet = pickle.loads(buf)
+
             for item in packet:
                 if item['type'] == 'config':
                     if rxBlock.status == ReceiverStatus.RUNNING_WINDOW:
                         rxBlock.stopWindow()
                         rxBlock.teardownWindow(runningWindow, blockAudioSink)
                     rx.applyConfigDict(item['data'])
-                elif item['type'] == 'kill':
-                    if rxBlock.status == ReceiverStatus.RUNNING_WINDOW:
-                        rxBlock.stopWindow()
-                    return
-                elif item['type'] == 'scan_window':
-                    windowId = item['data']
-                    scanWindow = rx.getScanWindow(windowId)
-                    runningWindow = scanWindow
-                    if rxBlock.status != ReceiverStatus.IDLE:
-                        raise Exception(f"Received new Scan Window {windowId} while not IDLE")
-                    #print(f"Scanning window {windowId} on {str(rxBlock)}")
-                    rxBlock.setupWindow(scanWindow, blockAudioSink)
-                    rxBlock.startWindow()
+                    scanWindows = rx.getScanWindows()
+                    statusSender.setScanWindows(scanWindows)
                 elif item['type'] == "ChannelMute":
                     ccId = item['data']['id']
                     mute = item['data']['mute']
@@ -376,6 +489,19 @@ def _runAsProcess(pipe, receiverConfig: ReceiverConfig, audioShmBuffer: shared_m
                         for c in sw.channels:
                             if c.id == ccId:
                                 c.setSolo(solo)
+                elif item['type'] == "ChannelSoloBatch":
+                    soloById = { u['id']: u['solo'] for u in item['data'] }
+                    for sw in rx._scanWindowsById.values():
+                        for c in sw.channels:
+                            if c.id in soloById:
+                                c.setSolo(soloById[c.id])
+                elif item['type'] == "ChannelEnable":
+                    ccId = item['data']['id']
+                    enable = item['data']['enable']
+                    for sw in rx._scanWindowsById.values():
+                        for c in sw.channels:
+                            if c.id == ccId:
+                                c.setEnabled(enable)
                 elif item['type'] == "ChannelHold":
                     ccId = item['data']['id']
                     hold = item['data']['hold']
@@ -395,13 +521,13 @@ def _runAsProcess(pipe, receiverConfig: ReceiverConfig, audioShmBuffer: shared_m
         # Check Running Window
 
         if rxBlock.status == ReceiverStatus.RUNNING_WINDOW:
-            rxBlock.checkWindow(pipe)
+            rxBlock.checkWindow(statusSender)
 
         # Cleanup from finished Window
 
         if rxBlock.status == ReceiverStatus.WINDOW_COMPLETE:
             if runningWindow is not None:
-                pipe.send([{'type': 'window_done', 'data': runningWindow.id}])
+                statusSender.sendWindowDone(runningWindow.id)
                 runningWindow = None
             rxBlock.teardownWindow(scanWindow, blockAudioSink)
             rxBlock.status = ReceiverStatus.IDLE
@@ -0,0 +1,233 @@
+import collections
+import queue
+import threading
+import time
+from typing import Any, Callable, Deque, Hashable, List, Optional
+
+
+class SPSCRingBuffer():
+    """
+    Fixed capacity FIFO between threads of one process, with exactly one thread putting and one thread getting.
+
+    queue.Queue takes a mutex (and notifies a Condition) on every put() / get(), which adds jitter to the Scanner
+    thread for the high rate status stream to the UI. Here the head (write) index is only updated by the producer
+    and the tail (read) index only by the consumer, so no lock is needed - the slot is stored before the head is
+    published, and under the GIL each of those stores is atomic.
+
+    The indexes count up without wrapping, the slot is index & mask.
+
+    The Event is only a wakeup for a consumer that wants to block in wait(), it is not used for exclusion.
+
+    Raises queue.Empty / queue.Full like queue.Queue, and get_many_nowait() matches faster_fifo.Queue so the
+    Scanner input queue reader drains it in batches.
+
+    With a coalesceKey function, put() never blocks or raises: when the buffer is full, items wait in an overflow
+    (guarded by a lock, only touched while the buffer is full), in order. A held item with the same (not None)
+    key is replaced by the newer one, so the overflow stays bounded and the latest item for each key always
+    arrives - counted in coalescedCount. The next put() moves the overflow into the buffer once there is space,
+    and a consumer that has drained the buffer takes from the overflow directly, so nothing waits on the producer.
+    """
+
+    # Print a warning on the first coalesced item, and then every this many
+    COALESCE_WARNING_INTERVAL = 10000
+
+    def __init__(self, capacity: int = 4096, coalesceKey: Optional[Callable[[Any], Optional[Hashable]]] = None):
+        """
+        capacity
+            rounded up to a power of two
+        coalesceKey
+            Make put() non-blocking - returns the key an item held while the buffer is full replaces older held
+            items by, or None to keep every such item
+        """
+        size = 1
+        while size < capacity:
+            size <<= 1
+
+        self.capacity = size
+        self._mask = size - 1
+        self._buf: List[Any] = [None] * size
+        self._head = 0  # next slot to write, producer only
+        self._tail = 0  # next slot to read, consumer only
+        self._notEmptyEvent = threading.Event()
+
+        self._coalesceKey = coalesceKey
+        # Held items by coalesce key, or by a sequence number for those without one - oldest first
+        self._overflow: "collections.OrderedDict[Hashable, Any]" = collections.OrderedDict()
+        self._overflowSeq = 0
+        self._overflowLock = threading.Lock()
+        self.coalescedCount = 0
+
+    def qsize(self) -> int:
+        return self._head - self._tail + len(self._overflow)
+
+    def empty(self) -> bool:
+        return self._head == self._tail and not self._overflow
+
+    def put(self, item: Any, block: bool = True):
+        """
+        Producer only. A full buffer waits for the consumer, or raises queue.Full if not blocking - unless the
+        buffer was built with a coalesceKey, see _putOrHold().
+        """
+        if self._coalesceKey is not None:
+            self._putOrHold(item)
+            return
+
+        head = self._head
+        while head - self._tail >= self.capacity:
+            if not block:
+                raise queue.Full
+            time.sleep(0.001)
+
+        self._write(item)
+
+    def put_nowait(self, item: Any):
+        self.put(item, block=False)
+
+    def _putOrHold(self, item: Any):
+        """
+        Never waits for the consumer, so a stalled consumer can't stall the producer
+        """
+        # Only the producer adds to the overflow, so an empty one can't fill in between - no lock needed
+        if not self._overflow and self._head - self._tail < self.capacity:
+            self._write(item)
+            return
+
+        with self._overflowLock:
+            overflow = self._overflow
+            # Anything held goes first, to keep the order
+            while overflow and self._head - self._tail < self.capacity:
+                self._write(overflow.popitem(last=False)[1])
+
+            if not overflow and self._head - self._tail < self.capacity:
+                self._write(item)
+                return
+
+            key = self._coalesceKey(item)
+            if key is None:
+                key = self._overflowSeq
+                self._overflowSeq += 1
+            elif key in overflow:
+                # The newer item takes the place a fresh one would
+                overflow.move_to_end(key)
+                self.coalescedCount += 1
+                if self.coalescedCount % self.COALESCE_WARNING_INTERVAL == 1:
+                    print(f"WARNING: SPSCRingBuffer full, coalesced {self.coalescedCount} items")
+            overflow[key] = item
+
+    def _takeOverflow(self, maxItems: int) -> List[Any]:
+        """
+        Consumer only. Up to maxItems held items, oldest first - none unless the buffer is drained, as everything
+        held is newer than what's in the buffer.
+        """
+        with self._overflowLock:
+            overflow = self._overflow
+            if self._head != self._tail or not overflow:
+                return []
+            return [overflow.popitem(last=False)[1] for _ in range(min(len(overflow), maxItems))]
+
+    def _write(self, item: Any):
+        head = self._head
+        self._buf[head & self._mask] = item
+        # Publish after the slot is stored
+        self._head = head + 1
+        # is_set() doesn't lock, only take the Event's lock when a wakeup is actually needed
+        if not self._notEmptyEvent.is_set():
+            self._notEmptyEvent.set()
+
+    def pop(self) -> Optional[Any]:
+        """
+        Consumer only. Non-blocking, returns None if empty - cheaper than catching queue.Empty per drain.
+        """
+        tail = self._tail
+        if tail == self._head:
+            if not self._overflow:
+                return None
+            held = self._takeOverflow(1)
+            if held:
+                return held[0]
+            # The producer moved the overflow into the buffer in between
+            if tail == self._head:
+                return None
+
+        idx = tail & self._mask
+        item = self._buf[idx]
+        self._buf[idx] = None  # don't keep a reference to the message
+        self._tail = tail + 1
+        return item
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Consumer only, queue.Queue style
+        """
+        while True:
+            if self._tail != self._head or self._overflow:
+                item = self.pop()
+                if item is not None:
+                    return item
+                continue
+            if not block or not self.wait(timeout):
+                raise queue.Empty
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def get_many_nowait(self, max_messages_to_get: int = 1000) -> List[Any]:
+        """
+        Consumer only. Returns up to max_messages_to_get items, raises queue.Empty if there are none.
+        """
+        tail = self._tail
+        numItems = min(self._head - tail, max_messages_to_get)
+
+        buf = self._buf
+        mask = self._mask
+        items = []
+        for i in range(tail, tail + numItems):
+            idx = i & mask
+            items.append(buf[idx])
+            buf[idx] = None
+        self._tail = tail + numItems
+
+        if numItems < max_messages_to_get and self._overflow:
+            items.extend(self._takeOverflow(max_messages_to_get - numItems))
+
+        if not items:
+            raise queue.Empty
+        return items
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Consumer only. Wait until there is something to get, returns False on timeout.
+        """
+        # Clear, then re-check before waiting so a put() in between isn't missed
+        self._notEmptyEvent.clear()
+        if self._head != self._tail or self._overflow:
+            return True
+        return self._notEmptyEvent.wait(timeout)
+
+    def task_done(self):
+        """
+        queue.Queue compatibility, nothing to do
+        """
+        pass
+
+
+def drainQueue(q: queue.Queue) -> Deque[Any]:
+    """
+    Take everything waiting in a queue.Queue with a single acquire of its mutex, instead of a get() + task_done()
+    (two acquires) per item. The items are marked done, as if task_done() had been called for each.
+
+    Returns the items, oldest first - an empty deque if there were none.
+    """
+    with q.mutex:
+        items = q.queue
+        if not items:
+            return collections.deque()
+        q.queue = collections.deque()
+
+        q.not_full.notify_all()
+        q.unfinished_tasks -= len(items)
+        if q.unfinished_tasks <= 0:
+            q.unfinished_tasks = 0
+            q.all_tasks_done.notify_all()
+
+    return items
@@ -102,10 +102,10 @@ class ScanWindow():
         )
         return sw
 
-    def isActive(self, statusPipe):
+    def isActive(self, statusSender):
         active = False
         for channel in self.channels:
-            if channel.getStatus(statusPipe) != ChannelStatus.IDLE:
+            if channel.getStatus(statusSender) != ChannelStatus.IDLE:
                 active = True
         return active
 
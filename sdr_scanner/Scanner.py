@@ -1,20 +1,37 @@
-from multiprocessing import Pipe, Process
+import math
+import mmap
+from multiprocessing import shared_memory, Event, Pipe, Process
+from multiprocessing import connection
+import numpy
+import os
 import queue
 import sys
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import yaml
 
 from .const import MAX_RF_SAMPLERATE
 from .AudioServer import AudioServerConfig, AudioSender
-from .Channel import ChannelConfig
-from .Receiver import ReceiverConfig, runAsProcess
+from .Channel import ChannelConfig, ChannelStatus
+from .Receiver import (
+    PIPE_MSG_SCAN_WINDOW, PIPE_MSG_SCAN_WINDOW_STRUCT, RECEIVER_RECORD_BUFFER_LEN,
+    RECEIVER_RECORD_DTYPE, ReceiverConfig, ReceiverRecordType, runAsProcess,
+)
+from .RingBuffer import drainQueue
 from .ScanWindow import ScanWindowConfig
+from .hpSharedMem import HighPerformanceCircularBuffer
+
+try:
+    # libyaml based loader, much faster when PyYAML was built with it
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
 
 class Scanner():
     MAINTENANCE_LOOP_TIME_S = 60
+    INPUT_QUEUE_BATCH_SIZE = 128
 
     def __init__(self, controlWebsocketHost: Optional[str] = None, controlWebsocketPort: Optional[int] = None) -> None:
         """
@@ -25,10 +42,23 @@ class Scanner():
         self.channelConfigs: List[ChannelConfig] = []
         self._channelConfigByIdCache: Dict[str, ChannelConfig] = {}
 
+        # Enabled channels sorted by freq, rebuilt when _enabledChannelsDirty is set (see _getEnabledChannelsSorted)
+        self._enabledChannelsDirty = True
+        self._enabledChannelsSorted: List[ChannelConfig] = []
+        self._enabledFreqsSorted = numpy.zeros(0, dtype=numpy.float64)
+
+        self._soloCount = 0  # Channels with solo set, Solo mode is active while non-zero
+
         self.scanWindowConfigs: List[ScanWindowConfig] = []
+        self._scanWindowConfigByChannelId: Dict[str, ScanWindowConfig] = {}
 
         self.receiverConfigs: List[ReceiverConfig] = []
-        self._receiverProcesses = []  # tuples of (receiverConfig, receiver, pipe, process)
+        # Running Receivers, parallel lists
+        self._rxConfigs: List[ReceiverConfig] = []
+        self._rxPipes: List[connection.Connection] = []
+        self._rxProcesses: List[Process] = []
+        self._rxStatusBuffers: List[HighPerformanceCircularBuffer] = []
+        self._receiverStatusShmBuffers: List[shared_memory.SharedMemory] = []
         self._receiverSampleRates: Dict[Any, List[int]] = {}
 
         self._defaultChannelConfig = ChannelConfig(0, 'DEFAULT')
@@ -38,8 +68,15 @@ class Scanner():
         self._controlWsStopEvent: Optional[threading.Event] = None
         self._controlWsThread: Optional[threading.Thread] = None
 
-        self._receiverCurrentScanWindow = {}
-        self._windowLastScan = {}  # {windowId: time.time()}
+        # Index in scanWindowConfigs of the window each Receiver is scanning, or None
+        self._receiverCurrentScanWindow: Dict[Any, Optional[int]] = {}
+        # Indexed by position in scanWindowConfigs, allocated by buildWindows()
+        self._windowLastScan = numpy.zeros(0, dtype=numpy.float64)  # time.time()
+        self._windowRunning = numpy.zeros(0, dtype=bool)
+
+        # Prebuilt per-window UI messages, indexed like _windowLastScan, built by buildWindows()
+        self._scanWindowDoneMsgs: List[Dict[str, Any]] = []
+        self._scanWindowStartMsgs: List[Dict[Any, Dict[str, Any]]] = []  # [{rxId: msg}]
 
         self._scanWindowConfigCallbacks = []
 
@@ -59,8 +96,10 @@ class Scanner():
 
     @classmethod
     def fromConfigFile(cls, configFilePath: str, controlWebsocketHost: Optional[str] = None, controlWebsocketPort: Optional[int] = None) -> "Scanner":
-        with open(configFilePath, 'r') as F_CONFIG:
-            configDict = yaml.safe_load(F_CONFIG)
+        with open(configFilePath, 'rb') as F_CONFIG:
+            # Parse straight from the mapped file
+            with mmap.mmap(F_CONFIG.fileno(), 0, access=mmap.ACCESS_READ) as configMap:
+                configDict = yaml.load(configMap, Loader=YamlSafeLoader)
 
             scanner = cls(controlWebsocketHost, controlWebsocketPort)
 
@@ -96,6 +135,9 @@ class Scanner():
                 cc = ChannelConfig.fromConfigDict(c, scanner._defaultChannelConfig)
 
                 scanner.channelConfigs.append(cc)
+                scanner._enabledChannelsDirty = True
+                if cc.solo:
+                    scanner._soloCount += 1
 
         return scanner
 
@@ -103,17 +145,26 @@ class Scanner():
         self._stopFlag = True
 
     def addInputQueue(self, inQueue: queue.Queue):
+        """
+        inQueue
+            queue.Queue, or a faster_fifo.Queue / SPSCRingBuffer which is drained in batches without the per-item locking
+        """
         self._inputQueues.append(inQueue)
 
     def addOutputQueue(self, outQueue: queue.Queue):
+        """
+        outQueue
+            queue.Queue, faster_fifo.Queue or SPSCRingBuffer (only if the Scanner thread is its single producer)
+        """
         self._outputQueues.append(outQueue)
 
     def addProcessQueueCallback(self, cb):
         self._processQueueCallbacks.append(cb)
 
     def getChannelById(self, channelId: str) -> Optional[ChannelConfig]:
-        if channelId in self._channelConfigByIdCache:
-            return self._channelConfigByIdCache[channelId]
+        cc = self._channelConfigByIdCache.get(channelId)
+        if cc is not None:
+            return cc
         for cc in self.channelConfigs:
             if cc.id == channelId:
                 self._channelConfigByIdCache[channelId] = cc
@@ -125,6 +176,11 @@ class Scanner():
     #                  Scanner Commands / UI Actions                  #
 
     def sendScannerMsg(self, msg):
+        """
+        Queue msg to every output queue.
+
+        The same msg object may be sent repeatedly (see buildWindows()) - consumers must treat messages as read-only.
+        """
         for oq in self._outputQueues:
             oq.put(msg)
         for cb in self._processQueueCallbacks:
@@ -138,52 +194,68 @@ class Scanner():
             },
         }
 
-    def _checkInputQueues(self):
+    def _readInputQueue(self, iq) -> List[Dict[str, Any]]:
         """
-        Check the Scanner input queues for commands / config updates
+        Return all of the messages currently waiting in an input queue
         """
-        for iq in self._inputQueues:
+        # faster_fifo.Queue - fetch in batches
+        getManyNowait = getattr(iq, 'get_many_nowait', None)
+        if getManyNowait is not None:
+            msgs = []
             try:
                 while True:
-                    data = iq.get(False)
-                    if data['type'] == "ChannelEnable":
-                        channelId = data['data']['id']
-                        enabled = bool(data['data']['enabled'])
-                        self._channelEnable(channelId, enabled)
-                    elif data['type'] == "ChannelMute":
-                        channelId = data['data']['id']
-                        mute = bool(data['data']['mute'])
-                        self._channelMute(channelId, mute)
-                    elif data['type'] == "ChannelSolo":
-                        channelId = data['data']['id']
-                        solo = bool(data['data']['solo'])
-                        self._channelSolo(channelId, solo)
-                    elif data['type'] == "ChannelHold":
-                        channelId = data['data']['id']
-                        hold = bool(data['data']['hold'])
-                        self._channelHold(channelId, hold)
-                    elif data['type'] == "ChannelDisableUntil":
-                        channelId = data['data']['id']
-                        disableUntil = float(data['data']['disableUntil'])
-                        self._channelDisableUntil(channelId, disableUntil)
-                    elif data['type'] == "ChannelForceActive":
-                        channelId = data['data']['id']
-                        forceActive = bool(data['data']['forceActive'])
-                        self._channelForceActive(channelId, forceActive)
-
-
-                    iq.task_done()
+                    msgs.extend(getManyNowait(max_messages_to_get=self.INPUT_QUEUE_BATCH_SIZE))
             except queue.Empty:
                 pass
+            return msgs
+
+        # queue.Queue - take the whole backlog under one lock
+        return list(drainQueue(iq))
+
+    def _checkInputQueues(self):
+        """
+        Check the Scanner input queues for commands / config updates
+        """
+        for iq in self._inputQueues:
+            for data in self._readInputQueue(iq):
+                if data['type'] == "ChannelEnable":
+                    channelId = data['data']['id']
+                    enabled = bool(data['data']['enabled'])
+                    self._channelEnable(channelId, enabled)
+                elif data['type'] == "ChannelMute":
+                    channelId = data['data']['id']
+                    mute = bool(data['data']['mute'])
+                    self._channelMute(channelId, mute)
+                elif data['type'] == "ChannelSolo":
+                    channelId = data['data']['id']
+                    solo = bool(data['data']['solo'])
+                    self._channelSolo(channelId, solo)
+                elif data['type'] == "ChannelHold":
+                    channelId = data['data']['id']
+                    hold = bool(data['data']['hold'])
+                    self._channelHold(channelId, hold)
+                elif data['type'] == "ChannelDisableUntil":
+                    channelId = data['data']['id']
+                    disableUntil = float(data['data']['disableUntil'])
+                    self._channelDisableUntil(channelId, disableUntil)
+                elif data['type'] == "ChannelForceActive":
+                    channelId = data['data']['id']
+                    forceActive = bool(data['data']['forceActive'])
+                    self._channelForceActive(channelId, forceActive)
+                elif data['type'] == "ScannerStop":
+                    # Don't apply anything queued behind the stop
+                    self.stop()
+                    return
 
     def _channelEnable(self, channelId: str, enable: bool=True):
         cc = self.getChannelById(channelId)
         if not cc:
             raise Exception(f"Channel '{channelId}' not found")
 
-        if cc.isEnabled() != enable:
-            self._configDirty = True
+        changed = cc.isEnabled() != enable
         cc.enable(enable)
+        if changed:
+            self._applyChannelEnabled(cc)
 
     def _channelDisableUntil(self, channelId: str, disableUntil: float):
         """
@@ -197,9 +269,35 @@ class Scanner():
         if not cc:
             raise Exception(f"Channel '{channelId}' not found")
 
-        if cc.isEnabled():
-            self._configDirty = True
+        changed = cc.isEnabled()
         cc.disableUntil(disableUntil)
+        if changed:
+            self._applyChannelEnabled(cc)
+
+    def _applyChannelEnabled(self, cc: ChannelConfig):
+        """
+        Push an enable / disable change out.
+
+        If the channel is already in a built ScanWindow the Receivers toggle it in place, otherwise (or if its window
+        would have no enabled channels left) the windows are rebuilt, which restarts the Receivers.
+        """
+        self._enabledChannelsDirty = True
+
+        swc = self._scanWindowConfigByChannelId.get(cc.id)
+        if swc is None or not any( c.isEnabled() for c in swc.channelConfigs ):
+            self._configDirty = True
+        else:
+            for pipe in self._rxPipes:
+                pipe.send([
+                    {
+                        'type': 'ChannelEnable',
+                        'data': {
+                            'id': cc.id,
+                            'enable': cc.isEnabled(),
+                        }
+                    }
+                ])
+        self.sendUpdatedChannelConfig(cc)
 
     def _channelMute(self, channelId: str, mute):
         cc = self.getChannelById(channelId)
@@ -208,7 +306,7 @@ class Scanner():
         print(f"Set Channel Mute: {mute} {channelId}")
         cc.mute = mute
 
-        for receiver, pipe, process in self._receiverProcesses:
+        for pipe in self._rxPipes:
             pipe.send([
                 {
                     'type': 'ChannelMute',
@@ -225,28 +323,48 @@ class Scanner():
         if not cc:
             raise Exception(f"Channel '{channelId}' not found")
         print(f"Set Channel Solo: {solo} {channelId}")
+
+        wasSoloActive = self._soloCount > 0
+        if bool(cc.solo) != solo:
+            self._soloCount += 1 if solo else -1
         cc.solo = solo
+        soloActive = self._soloCount > 0
 
-        soloActive = solo or any( c.solo for c in self.channelConfigs )
+        if soloActive == wasSoloActive:
+            # Only this channel changed
+            changedCCs = [cc]
+        else:
+            # Entering / leaving Solo mode changes every Channel
+            changedCCs = self.channelConfigs
 
-        for cc in self.channelConfigs:
+        updates = []
+        for cc in changedCCs:
             if soloActive:
                 setSolo: Optional[bool] = bool(cc.solo)
             else:
                 # Update all Channels to None
                 cc.solo = None
                 setSolo = None
+            updates.append({
+                'id': cc.id,
+                'solo': setSolo,
+            })
 
-            for receiver, pipe, process in self._receiverProcesses:
-                pipe.send([
-                    {
-                        'type': 'ChannelSolo',
-                        'data': {
-                            'id': cc.id,
-                            'solo': setSolo,
-                        }
-                    }
-                ])
+        if len(updates) == 1:
+            receiverMsg = {
+                'type': 'ChannelSolo',
+                'data': updates[0],
+            }
+        else:
+            # One message per Receiver for the whole update
+            receiverMsg = {
+                'type': 'ChannelSoloBatch',
+                'data': updates,
+            }
+        for pipe in self._rxPipes:
+            pipe.send([receiverMsg])
+
+        for cc in changedCCs:
             self.sendUpdatedChannelConfig(cc)
 
     def _channelHold(self, channelId: str, hold):
@@ -256,7 +374,7 @@ class Scanner():
         print(f"Set Channel Hold: {hold} {channelId}")
         cc.hold = hold
 
-        for receiver, pipe, process in self._receiverProcesses:
+        for pipe in self._rxPipes:
             pipe.send([
                 {
                     'type': 'ChannelHold',
@@ -275,7 +393,7 @@ class Scanner():
         print(f"Set Channel Force Active: {forceActive} {channelId}")
         cc.forceActive = forceActive
 
-        for receiver, pipe, process in self._receiverProcesses:
+        for pipe in self._rxPipes:
             pipe.send([
                 {
                     'type': 'ChannelForceActive',
@@ -307,26 +425,46 @@ class Scanner():
 
     def processReceiverMsg(self, receiverId, msg):
         for item in msg:
-            if item['type'] == 'window_done':
-                windowId = item['data']
-                self._windowLastScan[windowId] = time.time()
+            if item['type'] == 'sample_rates':
+                self._receiverSampleRates[receiverId] = item['data']
+
+    def processReceiverRecords(self, receiverId, records):
+        """
+        Handle the records read from a Receiver's status buffer (see RECEIVER_RECORD_DTYPE)
+        """
+        for record in records:
+            windowIdx = record['windowIdx']
+            swc = self.scanWindowConfigs[windowIdx]
+            if record['type'] == ReceiverRecordType.WINDOW_DONE:
+                self._windowLastScan[windowIdx] = time.time()
+                self._windowRunning[windowIdx] = False
                 self._receiverCurrentScanWindow[receiverId] = None
+                self.sendScannerMsg(self._scanWindowDoneMsgs[windowIdx])
+            elif record['type'] == ReceiverRecordType.CHANNEL_STATUS:
+                rssi = float(record['rssi'])
+                noiseFloor = float(record['noiseFloor'])
+                volume = float(record['volume'])
+                cc = swc.channelConfigs[record['channelIdx']]
+                if math.isnan(rssi):
+                    rssi = None
+                    rssiOverThreshold = None
+                else:
+                    # Against the threshold the sample was taken with, so consumers don't need the ChannelConfig
+                    rssiOverThreshold = rssi - cc.squelchThreshold
                 self.sendScannerMsg({
-                    "type": "ScanWindowDone",
+                    "type": "ChannelStatus",
                     "data": {
-                        "id": windowId,
+                        'id': cc.id,
+                        'status': ChannelStatus(record['status']),
+                        'rssi': rssi,
+                        'rssiOverThreshold': rssiOverThreshold,
+                        'noiseFloor': None if math.isnan(noiseFloor) else noiseFloor,
+                        'volume': None if math.isnan(volume) else volume,
                     }
                 })
-            elif item['type'] == 'channel_status':
-                self.sendScannerMsg({
-                    "type": "ChannelStatus",
-                    "data": item['data']
-                })
-            elif item['type'] == 'sample_rates':
-                self._receiverSampleRates[receiverId] = item['data']
 
     def syncToReceivers(self):
-        for receiver, pipe, process in self._receiverProcesses:
+        for pipe in self._rxPipes:
             pipe.send([
                 {
                     'type': 'config',
@@ -360,20 +498,45 @@ class Scanner():
 
         self.scanWindowConfigs = []
 
-        freqsToAllocate = { cc.freq_hz for cc in self.channelConfigs if cc.isEnabled() }
-        while freqsToAllocate:
-            lowFreq = sorted(freqsToAllocate)[0]
+        # Sort once, then walk the list - each window takes the next run of channels starting at the lowest unallocated
+        sortedCCs, sortedFreqs = self._getEnabledChannelsSorted()
+        i = 0
+        while i < len(sortedCCs):
+            lowFreq = sortedCCs[i].freq_hz
             hardwareFreq = lowFreq + bandwidth / 2 - BAND_EDGE_MARGIN
             highFreq = 2*hardwareFreq - lowFreq
 
-            ccs = [cc for cc in self.channelConfigs if cc.isEnabled() and cc.freq_hz >= lowFreq and cc.freq_hz <= highFreq]
-            if len(ccs) > self.maxChannelsPerWindow:
-                ccs = sorted(ccs, key=lambda x: x.freq_hz)[0:self.maxChannelsPerWindow]
-            for cc in ccs:
-                freqsToAllocate.remove(cc.freq_hz)
+            j = int(numpy.searchsorted(sortedFreqs, highFreq, side='right'))
+            ccs = sortedCCs[i:min(j, i + self.maxChannelsPerWindow)]
+            i += len(ccs)
             swc = ScanWindowConfig(hardwareFreq, bandwidth, ccs)
             self.scanWindowConfigs.append(swc)
 
+        self._windowLastScan = numpy.zeros(len(self.scanWindowConfigs), dtype=numpy.float64)
+        self._windowRunning = numpy.zeros(len(self.scanWindowConfigs), dtype=bool)
+
+        self._scanWindowConfigByChannelId = {}
+        self._scanWindowDoneMsgs = []
+        self._scanWindowStartMsgs = []
+        for swc in self.scanWindowConfigs:
+            self._scanWindowDoneMsgs.append({
+                "type": "ScanWindowDone",
+                "data": {
+                    "id": swc.id,
+                }
+            })
+            self._scanWindowStartMsgs.append({
+                r.id: {
+                    "type": "ScanWindowStart",
+                    "data": {
+                        "id": swc.id,
+                        "rxId": r.id,
+                    }
+                } for r in self.receiverConfigs
+            })
+            for cc in swc.channelConfigs:
+                self._scanWindowConfigByChannelId[cc.id] = swc
+
         for swc in self.scanWindowConfigs:
             swc.debugPrint()
 
@@ -381,24 +544,33 @@ class Scanner():
             "type": "ScanWindowConfigsChanged"
         })
 
-    def getNextScanWindow(self):
+    def _getEnabledChannelsSorted(self) -> Tuple[List[ChannelConfig], numpy.ndarray]:
+        """
+        Enabled ChannelConfigs sorted by freq, along with their freqs as an array for searchsorted
+        """
+        if self._enabledChannelsDirty:
+            self._enabledChannelsSorted = sorted((cc for cc in self.channelConfigs if cc.isEnabled()), key=lambda x: x.freq_hz)
+            self._enabledFreqsSorted = numpy.fromiter(
+                (cc.freq_hz for cc in self._enabledChannelsSorted),
+                dtype=numpy.float64,
+                count=len(self._enabledChannelsSorted),
+            )
+            self._enabledChannelsDirty = False
+        return self._enabledChannelsSorted, self._enabledFreqsSorted
+
+    def getNextScanWindow(self) -> Optional[int]:
+        """
+        Index in scanWindowConfigs of the next window to scan, or None if they're all running
+        """
         # Future:
         #   - Give priority to any windows with a Hold
         #   - Give priority to Windows with a Priority channel if an existing Window is Active on another receiver
-        targetId = None
-        targetTime = None
-        runningWindows = self._receiverCurrentScanWindow.values()
-        for sw in self.scanWindowConfigs:
-            if sw.id not in runningWindows:
-                if targetId is None:
-                    targetId = sw.id
-                    targetTime = self._windowLastScan.get(targetId, 0)
-                else:
-                    compTime = self._windowLastScan.get(sw.id, 0)
-                    if compTime < targetTime:
-                        targetId = sw.id
-                        targetTime = compTime
-        return targetId
+        idleWindowIdxs = numpy.flatnonzero(~self._windowRunning)
+        if not len(idleWindowIdxs):
+            return None
+        # Least recently scanned, first window wins ties
+        targetIdx = idleWindowIdxs[numpy.argmin(self._windowLastScan[idleWindowIdxs])]
+        return int(targetIdx)
 
     #                          Scan Windows                           #
     #                                                                 #
@@ -453,14 +625,57 @@ class Scanner():
             if self._stopFlag:
                 self.audioServerProcess.kill()
                 self.audioServerConfig.cleanup()
+                self._cleanupReceiverStatusBuffers()
                 if self._controlWsStopEvent is not None:
                     self._controlWsStopEvent.set()
                 return
 
+    def _pinReceiverProcess(self, process: Process, receiverIdx: int, numReceivers: int):
+        """
+        Give a Receiver process its own set of cores - GNU Radio runs a thread per block, so a Receiver gets an
+        equal share of the cores rather than a single one.
+
+        The first core is left out of every set so the Receivers don't compete with the Scanner / AudioServer
+        processes there - those aren't pinned, the OS may still run them on any core. With more Receivers than
+        remaining cores, Receivers share single cores round-robin. No-op where sched_setaffinity isn't available
+        or with only one core.
+        """
+        if not hasattr(os, 'sched_setaffinity'):
+            return
+        cores = sorted(os.sched_getaffinity(0))
+        if len(cores) < 2:
+            return
+        receiverCores = cores[1:]
+        if numReceivers <= len(receiverCores):
+            # Disjoint, contiguous sets - the first (len % numReceivers) Receivers get one extra core
+            perReceiver, extra = divmod(len(receiverCores), numReceivers)
+            start = receiverIdx * perReceiver + min(receiverIdx, extra)
+            coreSet = set(receiverCores[start:start + perReceiver + (receiverIdx < extra)])
+        else:
+            coreSet = { receiverCores[receiverIdx % len(receiverCores)] }
+        try:
+            os.sched_setaffinity(process.pid, coreSet)
+        except OSError as e:
+            print(f"Couldn't pin Receiver process to cores {sorted(coreSet)}")
+            print(e)
+
+    def _cleanupReceiverStatusBuffers(self):
+        """
+        Release the Receiver status ShmBuffers
+        """
+        for shmBuf in self._receiverStatusShmBuffers:
+            shmBuf.close()
+            shmBuf.unlink()
+        self._receiverStatusShmBuffers = []
+
     def _runReceivers(self):
 
-        self._receiverProcesses = []
+        self._rxConfigs = []
+        self._rxPipes = []
+        self._rxProcesses = []
+        self._rxStatusBuffers = []
         self._receiverSampleRates = {}
+        self._receiverStatusShmBuffers = []
 
 
         ###
@@ -471,9 +686,25 @@ class Scanner():
 
             receiverPipe, remotePipe = Pipe()
 
-            p = Process(target=runAsProcess, daemon=True, args=(remotePipe, rxConfig, *self.audioServerConfig.getInputShmBuffers(i) ))
-            self._receiverProcesses.append( (rxConfig, receiverPipe, p) )
+            # Buffer for the high rate channel_status / window_done records
+            statusNotFullEvent = Event()
+            statusBuffer = HighPerformanceCircularBuffer.create(RECEIVER_RECORD_BUFFER_LEN, RECEIVER_RECORD_DTYPE, statusNotFullEvent)
+            statusShmBuffer = statusBuffer.shmBuffer
+            self._receiverStatusShmBuffers.append(statusShmBuffer)
+
+            p = Process(target=runAsProcess, daemon=True, args=(
+                remotePipe,
+                rxConfig,
+                statusShmBuffer,
+                statusNotFullEvent,
+                *self.audioServerConfig.getInputShmBuffers(i)
+            ))
+            self._rxConfigs.append(rxConfig)
+            self._rxPipes.append(receiverPipe)
+            self._rxProcesses.append(p)
+            self._rxStatusBuffers.append(statusBuffer)
             p.start()
+            self._pinReceiverProcess(p, i, len(self.receiverConfigs))
 
             # Wait for the receiver to report back it's sample rates
             timeoutTime = time.time() + 10.0
@@ -492,6 +723,9 @@ class Scanner():
             i += 1
 
 
+        # Reused for every status buffer read - records are handled before the next read
+        recordBuffer = numpy.zeros(RECEIVER_RECORD_BUFFER_LEN, dtype=RECEIVER_RECORD_DTYPE)
+
         # Now we can build the windows
         self.buildWindows()
 
@@ -519,42 +753,48 @@ class Scanner():
             ###
             # Check Receivers
 
-            for rxConfig, pipe, process in self._receiverProcesses:
+            # Also serves as the loop delay - returns early if any Pipe has messages waiting
+            readyPipes = connection.wait(self._rxPipes, timeout=0.001)
+
+            for rxIdx, pipe in enumerate(self._rxPipes):
+                rxConfig = self._rxConfigs[rxIdx]
 
-                # Check if there are any messages in the Pipes
-                while pipe.poll():
-                    msg = pipe.recv()
+                # Drain any messages in the Pipe
+                if pipe in readyPipes:
+                    msg = []
+                    while pipe.poll():
+                        msg.extend(pipe.recv())
                     self.processReceiverMsg(rxConfig.id, msg)
 
+                # Check for status records
+                numRecords = self._rxStatusBuffers[rxIdx].read_into(recordBuffer)
+                if numRecords:
+                    self.processReceiverRecords(rxConfig.id, recordBuffer[:numRecords])
+
                 ###
                 # Assign ScanWindows
 
-                if not self._receiverCurrentScanWindow[rxConfig.id]:
+                if self._receiverCurrentScanWindow[rxConfig.id] is None:
                     # Assign new window
 
-                    nextWindowId = self.getNextScanWindow()
-                    self._receiverCurrentScanWindow[rxConfig.id] = nextWindowId
-                    pipe.send([{'type': 'scan_window', 'data': nextWindowId}])
-                    self.sendScannerMsg({
-                        "type": "ScanWindowStart",
-                        "data": {
-                            "id": nextWindowId,
-                            "rxId": rxConfig.id,
-                        }
-                    })
-
-            time.sleep(0.001)
+                    nextWindowIdx = self.getNextScanWindow()
+                    if nextWindowIdx is None:
+                        # Every window is already running on another Receiver
+                        continue
+                    self._receiverCurrentScanWindow[rxConfig.id] = nextWindowIdx
+                    self._windowRunning[nextWindowIdx] = True
+                    pipe.send_bytes(PIPE_MSG_SCAN_WINDOW_STRUCT.pack(PIPE_MSG_SCAN_WINDOW, nextWindowIdx))
+                    self.sendScannerMsg(self._scanWindowStartMsgs[nextWindowIdx][rxConfig.id])
 
             if not self.audioServerProcess.is_alive():
                 print("ERROR: AudioServer Not Alive")
                 self._stopFlag = True
 
             if self._stopFlag or self._configDirty:
-                for rxConfig, pipe, process in self._receiverProcesses:
-                    # pipe.send([{'type': 'kill'}])
-                    # print("sent kill")
+                for process in self._rxProcesses:
                     process.kill()
                     process.join()
+                self._cleanupReceiverStatusBuffers()
                 # if self._stopFlag:
                 #     sys.exit(0)
                 return
@@ -564,9 +804,11 @@ class Scanner():
 # Message Types
 
 # Direction        'type'           data
-# Scanner <-> RX
-#     -->          scan_window       <WINDOW_ID>
-#     <--          window_done       <WINDOW_ID>
+# Scanner <-> RX (Pipe)
+#     -->          SCAN_WINDOW       <WINDOW_IDX>  (binary, see PIPE_MSG_SCAN_WINDOW_STRUCT)
+#     <--          sample_rates      [<SAMPLE_RATE>, ...]
 
-#     <--          channel_status    {'id':<CHANNEL_ID>, status: <ChannelStatus Enum>, ['rssi': <RSSI>] }
+# Scanner <-- RX (status buffer records, RECEIVER_RECORD_DTYPE)
+#     <--          WINDOW_DONE       windowIdx
+#     <--          CHANNEL_STATUS    windowIdx, channelIdx, status, rssi, noiseFloor, volume
 
@@ -1,7 +1,8 @@
 from multiprocessing import shared_memory
+from multiprocessing.synchronize import Event as EventType
 import numpy
 import time
-from typing import Any, List
+from typing import Any, List, Optional
 
 
 class HighPerformanceCircularBuffer():
@@ -13,102 +14,176 @@ class HighPerformanceCircularBuffer():
     Many of the Python-standard shared memory objects include built-in synchronization / locking which can severely
     degrade performance for high throughput applications.
 
-    Example Initialization of SharedMemory from main process:
+    The head / tail indexes are kept as uint32 in a HEADER_BYTES header at the start of the SharedMemory, the items
+    follow. A newly created SharedMemory is zero filled, so both start at 0.
 
-        from multiprocessing import shared_memory, Value
-        shmBuffer = shared_memory.SharedMemory(create=True, size=<nBytes>)  # buffer len = (nBytes // dtype.itemsize)
-        headPointer = Value('i', lock=False)
-        headPointer.value = 0
-        tailPointer = Value('i', lock=False)
-        tailPointer.value = 0
+    Use create() to allocate the SharedMemory from the main process, or by hand:
+
+        from multiprocessing import shared_memory, Event
+        # buffer len = (nBytes // dtype.itemsize)
+        shmBuffer = shared_memory.SharedMemory(create=True, size=HighPerformanceCircularBuffer.HEADER_BYTES + <nBytes>)
+
+        notFullEvent = Event()  # optional
 
     Pass those to the other process and init the CircularBuffer in each
         import numpy as np
         circularBuffer = HighPerformanceCircularBuffer(
             shmBuffer=shmBuffer,
             itemDtype=np.dtype('float32'),
-            headPointer=headPointer,
-            tailPointer=tailPointer,
+            notFullEvent=notFullEvent,
         )
+
+    With a notFullEvent, a blocking write() on a full buffer waits for the reader to free space instead of polling.
     """
 
+    # One cache line for the head / tail indexes, keeps the items aligned
+    HEADER_BYTES = 64
+    HEAD_IDX = 0
+    TAIL_IDX = 1
+
     def __init__(self,
                  shmBuffer: shared_memory.SharedMemory,
                  itemDtype: numpy.dtype,
-                 headPointer,
-                 tailPointer
+                 notFullEvent: Optional[EventType] = None,
         ):
         """
         """
         self.shmBuffer = shmBuffer
         self.itemDtype = itemDtype
-        self.headPointer = headPointer
-        self.tailPointer = tailPointer
+        self.notFullEvent = notFullEvent
 
-        self.bufferItemLen = self.shmBuffer.size // itemDtype.itemsize
-        
-        self.circularArray = numpy.ndarray(shape=(self.bufferItemLen), dtype=self.itemDtype, buffer=self.shmBuffer.buf)
+        self._pointers = numpy.ndarray(shape=(2,), dtype=numpy.uint32, buffer=self.shmBuffer.buf, offset=0)
+
+        self.bufferItemLen = (self.shmBuffer.size - self.HEADER_BYTES) // itemDtype.itemsize
+
+        self.circularArray = numpy.ndarray(
+            shape=(self.bufferItemLen),
+            dtype=self.itemDtype,
+            buffer=self.shmBuffer.buf,
+            offset=self.HEADER_BYTES,
+        )
         self.totalItemsWrote = 0
 
-    def write(self, items: List[Any], blockOnFull=True) -> int:
+    @classmethod
+    def create(cls, numItems: int, itemDtype: numpy.dtype, notFullEvent: Optional[EventType] = None) -> "HighPerformanceCircularBuffer":
+        """
+        Allocate a new SharedMemory that holds at least numItems, rounded up to a whole number of cache lines.
+
+        Size for the worst case stall of the reader so writes don't block, e.g. for a stream:
+            numItems = 2 * sampleRate * maxStall_s
+
+        Pass circularBuffer.shmBuffer to the other process, and close() / unlink() it when done.
+        """
+        # +1 - a full buffer keeps one slot empty
+        itemBytes = (numItems + 1) * itemDtype.itemsize
+        nBytes = cls.HEADER_BYTES + ((itemBytes + 63) // 64) * 64
+        shmBuffer = shared_memory.SharedMemory(create=True, size=nBytes)
+        return cls(shmBuffer, itemDtype, notFullEvent)
+
+    def write(self, items: numpy.ndarray, blockOnFull=True) -> int:
         """
         Returns the number of items written to the buffer
+
+        items
+            ndarray of itemDtype - other sequences are converted first
         """
-        
+
+        # No-op if already the correct dtype, so the copy below is a straight memcpy
+        items = numpy.asarray(items, dtype=self.itemDtype)
+
+        # Hot path - keep attribute / global lookups out of the loop
+        pointers = self._pointers
+        circularArray = self.circularArray
+        bufferItemLen = self.bufferItemLen
+        copyto = numpy.copyto
+        HEAD_IDX = self.HEAD_IDX
+        TAIL_IDX = self.TAIL_IDX
+
         numItems = len(items)
         itemIdx = 0
+        eventCleared = False
         while itemIdx < numItems:
-    
-            numToWrite = numItems - itemIdx
-            headIdx = self.headPointer.value
-            tailIdx = self.tailPointer.value
 
-            if headIdx < tailIdx:
-                spaceLeft = tailIdx - headIdx - 1
-            else:
-                spaceLeft = self.bufferItemLen - headIdx
-                if tailIdx == 0:
-                    spaceLeft -= 1  # Can't wrap around yet
+            headIdx = int(pointers[HEAD_IDX])
+            tailIdx = int(pointers[TAIL_IDX])
 
-            if numToWrite > spaceLeft:
-                numToWrite = spaceLeft
+            # Free slots (one always stays empty), limited to the contiguous run before the end of the buffer
+            numToWrite = min(numItems - itemIdx, (tailIdx - headIdx - 1) % bufferItemLen, bufferItemLen - headIdx)
 
             if numToWrite <= 0:
                 if not blockOnFull:
-                    return itemIdx
-                time.sleep(0.001)
+                    break
+                if self.notFullEvent is None:
+                    time.sleep(0.001)
+                elif not eventCleared:
+                    # Clear, then re-check the pointers before waiting so a read in between isn't missed
+                    self.notFullEvent.clear()
+                    eventCleared = True
+                else:
+                    self.notFullEvent.wait(timeout=0.01)
+                    eventCleared = False
                 continue
 
             # Write data, update pointers
-            self.circularArray[headIdx:headIdx + numToWrite] = items[itemIdx:itemIdx + numToWrite]
+            copyto(circularArray[headIdx:headIdx + numToWrite], items[itemIdx:itemIdx + numToWrite], casting='no')
             itemIdx += numToWrite
-            headIdx += numToWrite
-            self.totalItemsWrote += numToWrite
-            if headIdx > self.bufferItemLen:
-                raise Exception("Overwrote Buffer")
-            if headIdx >= self.bufferItemLen:
-                headIdx = 0
-            self.headPointer.value = headIdx
+            pointers[HEAD_IDX] = (headIdx + numToWrite) % bufferItemLen
 
+        self.totalItemsWrote += itemIdx
         return itemIdx
 
     def read(self, intoBuffer: List[Any]) -> int:
+        """
+        Legacy list interface - prefer read_into() with a preallocated ndarray
+
+        Returns the number of items appended to intoBuffer
+        """
 
         # NOTE: we'll only read up to the end of the buffer, if wrapped will pick up next read
 
-        headIdx = self.headPointer.value
-        tailIdx = self.tailPointer.value
-        newItemCount = 0
-        if headIdx >= tailIdx:
-            newItemCount = headIdx - tailIdx
-        else:
-            newItemCount = self.bufferItemLen - tailIdx
+        pointers = self._pointers
+        bufferItemLen = self.bufferItemLen
+        headIdx = int(pointers[self.HEAD_IDX])
+        tailIdx = int(pointers[self.TAIL_IDX])
+        newItemCount = min((headIdx - tailIdx) % bufferItemLen, bufferItemLen - tailIdx)
 
         if newItemCount:
             intoBuffer.extend(self.circularArray[tailIdx:tailIdx+newItemCount].copy())
-            tailIdx += newItemCount
-            if tailIdx >= self.bufferItemLen:
-                tailIdx = 0
-            self.tailPointer.value = tailIdx
+            pointers[self.TAIL_IDX] = (tailIdx + newItemCount) % bufferItemLen
+            if self.notFullEvent is not None:
+                self.notFullEvent.set()
 
         return newItemCount
+
+    def read_into(self, out: numpy.ndarray, offset: int = 0) -> int:
+        """
+        Copy available items directly into out[offset:], without intermediate allocations.
+
+        Reads across the wrap point, up to the space remaining in out.
+
+        Returns the number of items copied
+        """
+
+        pointers = self._pointers
+        circularArray = self.circularArray
+        bufferItemLen = self.bufferItemLen
+
+        headIdx = int(pointers[self.HEAD_IDX])
+        tailIdx = int(pointers[self.TAIL_IDX])
+        outLen = len(out)
+        itemsRead = 0
+        while offset < outLen and tailIdx != headIdx:
+            # Available items, limited to the contiguous run before the end of the buffer
+            newItemCount = min((headIdx - tailIdx) % bufferItemLen, bufferItemLen - tailIdx, outLen - offset)
+
+            numpy.copyto(out[offset:offset + newItemCount], circularArray[tailIdx:tailIdx + newItemCount])
+            offset += newItemCount
+            itemsRead += newItemCount
+            tailIdx = (tailIdx + newItemCount) % bufferItemLen
+
+        if itemsRead:
+            pointers[self.TAIL_IDX] = tailIdx
+            if self.notFullEvent is not None:
+                self.notFullEvent.set()
+
+        return itemsRead
@@ -1,88 +1,227 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import wx
 import wx.dataview as dv
 
-from .Channel import ChannelStatus
+from .Channel import ChannelConfig, ChannelStatus
 from .Scanner import Scanner
 
 
+def _buildStatusText() -> Tuple[str, ...]:
+    """
+    Status column text for each packed config state, see ConfigListModel._formatStatus:
+    bit 4 disabled, bit 3 temp disabled, bit 2 force active, bit 1 mute, bit 0 solo
+    """
+    table = []
+    for state in range(0, 32):
+        if state & 0x10:
+            table.append("Temp Disabled" if state & 0x08 else "Disabled")
+        elif state & 0x04:
+            table.append("Force Active")
+        elif state & 0x02:
+            table.append("Mute")
+        elif state & 0x01:
+            table.append("Solo")
+        else:
+            table.append("")
+    return tuple(table)
+
+_STATUS_TEXT = _buildStatusText()
+
+
 class ConfigListModel(dv.DataViewIndexListModel):
+    """
+    An index list model rather than a virtual one - wx only reorders the rows of an index list model when a
+    sortable column header is clicked, a virtual model is always shown in model order
+    """
+
+    NUM_COLS = 8
+    NUMERIC_COLS = (0, 4, 5, 6)
+
+    # SetChannelStatuses() does a Reset() instead of ItemsChanged() from this many changed rows. Reset() loses the
+    # selection and scroll position, so only for large configs where per-item notifications get expensive
+    RESET_MIN_CHANGED_ROWS = 500
+
+    # _attrByte bits
+    ATTR_ACTIVE = 1
+    ATTR_DWELL = 2  # DWELL / FORCE_ACTIVE
+    ATTR_DISABLED = 4  # Disabled / Mute / Solo
+
+    # Built once rather than on every cell paint - RGB, the colour database isn't available before the wx.App
+    _COL_ACTIVE = wx.Colour(0, 255, 0)  # 'green'
+    _COL_DWELL = wx.Colour(192, 192, 0)
+    _COL_DISABLED = wx.Colour(255, 0, 0)  # 'red'
+
     def __init__(self, data):
         dv.DataViewIndexListModel.__init__(self, len(data))
-        self.data = data
+
+        # ChannelConfigs by id, and the ids in row order
+        self._byId: Dict[str, ChannelConfig] = {}
+        self._order: List[str] = []
 
         self.channelIdToRow = {}
+        # Bound channelIdToRow lookup for the status hot path - rebound whenever channelIdToRow is rebuilt
+        self._rowOf = self.channelIdToRow.__getitem__
         self.rowStatus = {}
 
+        # Display strings, one list per column indexed by row - GetValueByRow is called for every cell on every paint
+        self._cols: List[List[str]] = [[] for _ in range(self.NUM_COLS)]
+        # Native sort keys for the numeric columns, indexed by row - other columns sort on their _cols strings
+        self._sortKeys: Dict[int, List[float]] = {}
+        # GetAttrByRow decision per row, see ATTR_*
+        self._attrByte = bytearray()
+        # Per column rank of each row, built on the first Compare of a sort and dropped when that column changes
+        self._sortRank: Dict[int, List[int]] = {}
+
         self.resetConfig(data)
 
     def resetConfig(self, data):
 
-        # Brute force config update, just rebuild all
+        # Brute force config update, just rebuild all - a single Reset() instead of per-row notifications
 
-        self.DeleteAllRows()
-        self.channelIdToRow = {}
-        self.rowStatus = {}
+        self._byId = { cc.id: cc for cc in data }
+        self._order = [cc.id for cc in data]
+        self.channelIdToRow = { ccId: i for i, ccId in enumerate(self._order) }
+        self._rowOf = self.channelIdToRow.__getitem__
+        self.rowStatus = { i: None for i in range(0, len(self._order)) }
 
-        for r in data:
-            self.AddRow(r)
+        self._cols = [[] for _ in range(self.NUM_COLS)]
+        self._sortKeys = { col: [] for col in self.NUMERIC_COLS }
+        self._attrByte = bytearray(len(self._order))
+        for row in range(0, len(self._order)):
+            for col, value in enumerate(self._formatRow(row)):
+                self._cols[col].append(value)
+            for col, value in self._sortKeysRow(row).items():
+                self._sortKeys[col].append(value)
+            self._attrByte[row] = self._computeAttrByte(row)
+        self._sortRank = {}
 
-        for i in range(0, len(self.data)):
-            cc = self.data[i]
-            self.channelIdToRow[cc.id] = i
-            self.rowStatus[i] = None
+        self.Reset(len(self._order))
 
-        self.Cleared()
+    def getChannelConfig(self, row) -> ChannelConfig:
+        return self._byId[self._order[row]]
 
     def SetChannelStatus(self, channelId, status: ChannelStatus):
-        rowId = self.channelIdToRow[channelId]
+        rowId = self._rowOf(channelId)
         item = self.GetItem(rowId)
         self.rowStatus[rowId] = status
+        self._cols[2][rowId] = self._formatStatus(rowId)
+        self._attrByte[rowId] = self._computeAttrByte(rowId)
+        self._sortRank.pop(2, None)
         self.ItemChanged(item)
 
+    def SetChannelStatuses(self, updates: Dict[str, ChannelStatus]):
+        """
+        Batched SetChannelStatus - a single ItemsChanged for all updated rows, or a Reset when very many changed
+        """
+        rowOf = self._rowOf
+        rows = []
+        for channelId, status in updates.items():
+            rowId = rowOf(channelId)
+            self.rowStatus[rowId] = status
+            self._cols[2][rowId] = self._formatStatus(rowId)
+            self._attrByte[rowId] = self._computeAttrByte(rowId)
+            rows.append(rowId)
+
+        if not rows:
+            return
+        self._sortRank.pop(2, None)
+
+        if len(rows) >= self.RESET_MIN_CHANGED_ROWS:
+            self.Reset(len(self._order))
+        else:
+            items = dv.DataViewItemArray()
+            for rowId in rows:
+                items.append(self.GetItem(rowId))
+            self.ItemsChanged(items)
+
     def channelConfigUpdated(self, channelId):
-        rowId = self.channelIdToRow[channelId]
+        rowId = self._rowOf(channelId)
         item = self.GetItem(rowId)
+        for col, value in enumerate(self._formatRow(rowId)):
+            self._cols[col][rowId] = value
+        for col, value in self._sortKeysRow(rowId).items():
+            self._sortKeys[col][rowId] = value
+        self._attrByte[rowId] = self._computeAttrByte(rowId)
+        self._sortRank = {}
         self.ItemChanged(item)
 
+    def _formatRow(self, row) -> List[str]:
+        cc = self.getChannelConfig(row)
+        return [
+            cc.getFreqLabel(),
+            str(cc.label),
+            self._formatStatus(row),
+            cc.mode.name,
+            str(cc.squelchThreshold),
+            str(cc.dwellTime_s),
+            str(cc.audioGain_dB),
+            str(cc.id),
+        ]
+
+    def _sortKeysRow(self, row) -> Dict[int, float]:
+        cc = self.getChannelConfig(row)
+        return {
+            0: cc.freq_hz,
+            4: cc.squelchThreshold,
+            5: cc.dwellTime_s,
+            6: cc.audioGain_dB,
+        }
+
+    def _computeAttrByte(self, row) -> int:
+        attrByte = 0
+        if self.rowStatus[row] == ChannelStatus.ACTIVE:
+            attrByte |= self.ATTR_ACTIVE
+        elif self.rowStatus[row] in [ ChannelStatus.DWELL, ChannelStatus.FORCE_ACTIVE ]:
+            attrByte |= self.ATTR_DWELL
+
+        cc = self.getChannelConfig(row)
+        if (not cc.isEnabled()) or cc.mute or cc.solo:
+            attrByte |= self.ATTR_DISABLED
+        return attrByte
+
+    def _formatStatus(self, row) -> str:
+        cc = self.getChannelConfig(row)
+        disabled = not cc.isEnabled()  # isEnabled() first, it clears an expired disableUntil
+        state = (
+            disabled << 4
+            | (disabled and cc._disableUntil is not None) << 3
+            | bool(cc.forceActive) << 2
+            | bool(cc.mute) << 1
+            | bool(cc.solo)
+        )
+        if state:
+            return _STATUS_TEXT[state]
+
+        status = self.rowStatus.get(row)
+        if status is not None and status != ChannelStatus.IDLE:
+            return status.name
+        return ""
+
+    def _getSortRank(self, col) -> List[int]:
+        """
+        Rank of each row in column col, equal values sharing a rank - one C level sort per column instead of
+        a Python key lookup and comparison on every Compare callback
+        """
+        rank = self._sortRank.get(col)
+        if rank is None:
+            keys = self._sortKeys.get(col) or self._cols[col]
+            rank = [0] * len(keys)
+            prev = None
+            r = -1
+            for row in sorted(range(len(keys)), key=keys.__getitem__):
+                if r < 0 or keys[row] != prev:
+                    r += 1
+                    prev = keys[row]
+                rank[row] = r
+            self._sortRank[col] = rank
+        return rank
+
     def GetColumnType(self, col):
         return "string"
 
     # This method is called to provide the data object for a particular row,col
     def GetValueByRow(self, row, col):
-        cc = self.data[row]
-        if col == 0:
-            return f"{cc.freq_hz/1e6:6.3f}"
-        elif col == 1:
-            return str(cc.label)
-        elif col == 2:
-            statusText = ""
-            if not cc.isEnabled():
-                if cc.disableUntil is not None:
-                    statusText = "Temp Disabled"
-                else:
-                    statusText = "Disabled"
-            elif cc.forceActive:
-                statusText = "Force Active"
-            elif cc.mute:
-                statusText = "Mute"
-            elif cc.solo:
-                statusText = "Solo"
-            elif self.rowStatus.get(row) is not None and self.rowStatus[row] != ChannelStatus.IDLE:
-                statusText = self.rowStatus[row].name
-            return statusText
-        elif col == 3:
-            return cc.mode.name
-        elif col == 4:
-            return str(cc.squelchThreshold)
-        elif col == 5:
-            return str(cc.dwellTime_s)
-        elif col == 6:
-            return str(cc.audioGain_dB)
-        elif col == 7:
-            return str(cc.id)
-
-        raise Exception(f"Invalid col: {col}")
+        return self._cols[col][row]
 
     # This method is called when the user edits a data item in the view.
     def SetValueByRow(self, value, row, col):
@@ -90,92 +229,57 @@ class ConfigListModel(dv.DataViewIndexListModel):
 
     # Report how many columns this model provides data for.
     def GetColumnCount(self):
-        return 8
+        return self.NUM_COLS
 
     # Report the number of rows in the model
     def GetCount(self):
-        return len(self.data)
+        return len(self._order)
 
     # Called to check if non-standard attributes should be used in the cell at (row, col)
     def GetAttrByRow(self, row, col, attr):
-        setColour = None
-        if self.rowStatus[row] == ChannelStatus.ACTIVE:
-            setColour = 'green'
-        elif self.rowStatus[row] in [ ChannelStatus.DWELL, ChannelStatus.FORCE_ACTIVE ]:
-            setColour = wx.Colour(192, 192, 0)
-
-        if (not self.data[row].isEnabled()) or self.data[row].mute or self.data[row].solo:
-            setColour = 'red'
-        if setColour is not None:
-            # apparently only supported in wxGTK 4.1+ - use text color for now
-            #attr.SetBackgroundColour('green')
-            attr.SetColour(setColour)
-            attr.SetBold(True)
-            return True
-        return False
+        attrByte = self._attrByte[row]
+        if not attrByte:
+            return False
+
+        if attrByte & self.ATTR_DISABLED:
+            setColour = self._COL_DISABLED
+        elif attrByte & self.ATTR_ACTIVE:
+            setColour = self._COL_ACTIVE
+        else:
+            setColour = self._COL_DWELL
+        # apparently only supported in wxGTK 4.1+ - use text color for now
+        #attr.SetBackgroundColour('green')
+        attr.SetColour(setColour)
+        attr.SetBold(True)
+        return True
 
     # This is called to assist with sorting the data in the view.  The
     # first two args are instances of the DataViewItem class, so we
     # need to convert them to row numbers with the GetRow method.
-    # Then it's just a matter of fetching the right values from our
-    # data set and comparing them.  The return value is -1, 0, or 1,
-    # just like Python's cmp() function.
+    # Rows are compared by their cached rank in the column, the
+    # return value is negative, 0, or positive like Python's cmp().
     def Compare(self, item1, item2, col, ascending):
-        if not ascending: # swap sort order?
-            item2, item1 = item1, item2
-        row1 = self.GetRow(item1)
-        row2 = self.GetRow(item2)
-        a = self.GetValueByRow(row1, col)
-        b = self.GetValueByRow(row2, col)
-        if col in [0, 4, 5, 6]:
-            a = float(a)
-            b = float(b)
-        if a < b: return -1
-        if a > b: return 1
-        return 0
-
-    def DeleteAllRows(self):
-        self.DeleteRows(range(0, len(self.data)))
-
-    def DeleteRows(self, rows):
-        # make a copy since we'll be sorting(mutating) the list
-        # use reverse order so the indexes don't change as we remove items
-        rows = sorted(rows, reverse=True)
-
-        for row in rows:
-            # remove it from our data structure
-            del self.data[row]
-            # notify the view(s) using this model that it has been removed
-            self.RowDeleted(row)
-
-    def AddRow(self, value):
-        # update data structure
-        self.data.append(value)
-        # notify views
-        self.RowAppended()
+        rank = self._getSortRank(col)
+        diff = rank[self.GetRow(item1)] - rank[self.GetRow(item2)]
+        return diff if ascending else -diff
 
 
 class ConfigDisplayFrame(wx.Frame):
 
-    _instance = None
-    _frameInitialized = False
+    _instance: Optional["ConfigDisplayFrame"] = None
 
-    def __new__(cls, scanner: Scanner, *args, **kwargs):
+    @classmethod
+    def getInstance(cls, scanner: Scanner, channelSelectCb, *args, **kw) -> "ConfigDisplayFrame":
         """
-        Ensure only one instance of the Frame is created.
+        Ensure only one instance of the Frame is created - returns the live Frame, or builds a new one
+        if there is none yet or the previous one has been destroyed.
         """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls, *args, **kwargs)
-        elif not cls._instance:  # wx Dead object check
-            cls._instance = super().__new__(cls, *args, **kwargs)
+        if not cls._instance:  # None, or wx Dead object
+            cls._instance = cls(scanner, channelSelectCb, *args, **kw)
         return cls._instance
 
     def __init__(self, scanner: Scanner, channelSelectCb, *args, **kw):
 
-        if self._frameInitialized:
-            return
-        self._frameInitialized = True
-        
         super().__init__(*args, **kw)
 
         self._scanner = scanner
@@ -241,6 +345,11 @@ class ConfigDisplayFrame(wx.Frame):
 
         self.dvlc.Bind(wx.dataview.EVT_DATAVIEW_SELECTION_CHANGED, self.onSelectChannel)
 
+        # Statuses received while the Frame is hidden / minimized, latest per channel - applied when it's shown again
+        self._deferredStatuses: Dict[str, ChannelStatus] = {}
+        self.Bind(wx.EVT_SHOW, self.onShow)
+        self.Bind(wx.EVT_ICONIZE, self.onIconize)
+
         # Associate Model
         self.dataModel = ConfigListModel([])
         self.dvlc.AssociateModel(self.dataModel)
@@ -256,25 +365,56 @@ class ConfigDisplayFrame(wx.Frame):
         item = event.GetItem()
         rowId = self.dataModel.GetRow(item)
         try:
-            cc = self.dataModel.data[rowId]
+            cc = self.dataModel.getChannelConfig(rowId)
             if cc:
                 self._channelSelectCb(cc.id)
         except IndexError:
             return
 
+    def onShow(self, event):
+        if event.IsShown():
+            self._applyDeferredStatuses()
+        event.Skip()
+
+    def onIconize(self, event):
+        if not event.IsIconized():
+            self._applyDeferredStatuses()
+        event.Skip()
+
+    def _isVisible(self) -> bool:
+        return self.IsShown() and not self.IsIconized()
+
+    def _applyDeferredStatuses(self):
+        if self._deferredStatuses:
+            self.dataModel.SetChannelStatuses(self._deferredStatuses)
+            self._deferredStatuses = {}
+
     def resetConfig(self):
+        # Statuses from before the reset may be of channels that are gone
+        self._deferredStatuses.clear()
+
         # Build Data from Config
-        channelData = []
-        for cc in self._scanner.channelConfigs:
-            channelData.append(cc)
+        channelData = list(self._scanner.channelConfigs)
 
+        # The model's Reset() already repaints the DataViewCtrl, no further Refresh() needed
         self.dataModel.resetConfig(channelData)
         self.Layout()
-        self.Refresh()
 
     def SetChannelStatus(self, channelId, status: ChannelStatus):
+        if not self._isVisible():
+            self._deferredStatuses[channelId] = status
+            return
         self.dataModel.SetChannelStatus(channelId, status)
 
+    def SetChannelStatuses(self, updates: Dict[str, ChannelStatus]):
+        """
+        Nothing to update on screen while the Frame is hidden or minimized, only the latest status per channel is kept
+        """
+        if not self._isVisible():
+            self._deferredStatuses.update(updates)
+            return
+        self.dataModel.SetChannelStatuses(updates)
+
     def channelConfigUpdated(self, channelId):
         self.dataModel.channelConfigUpdated(channelId)
 
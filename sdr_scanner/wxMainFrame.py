@@ -1,20 +1,77 @@
-import datetime
-from functools import partial
+import bisect
+from collections import deque, namedtuple
 import os.path
 import queue
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 import wx
 import wx.dataview as dv
 
 from .Channel import ChannelConfig, ChannelStatus
+from .RingBuffer import SPSCRingBuffer
 from .Scanner import Scanner
 from .wxConfigDisplayFrame import ConfigDisplayFrame
 
 
-scannerToUiQueue = queue.Queue()
-uiToScannerQueue = queue.Queue()
+# A coalesced ChannelStatus message, see MainFrame.processScannerData()
+ChannelStatusUpdate = namedtuple('ChannelStatusUpdate', 'id status rssi rssiOverThreshold noiseFloor volume')
+
+
+def _uiCoalesceKey(msg: Dict[str, Any]) -> Optional[Tuple]:
+    """
+    While scannerToUiQueue is full, a held message is replaced by a newer one with the same key - only the latest
+    ChannelStatus of each channel is displayed, ScanWindowStart / Done aren't displayed at all. Config messages
+    are all kept.
+    """
+    msgType = msg['type']
+    if msgType == "ChannelStatus":
+        return (msgType, msg['data']['id'])
+    if msgType == "ScanWindowStart" or msgType == "ScanWindowDone":
+        return (msgType,)
+    return None
+
+
+# Scanner thread -> wx main thread, and back - one producer and one consumer each. The Scanner must never wait on a
+# stalled UI, so scannerToUiQueue holds (and coalesces) messages while it is full instead of blocking
+scannerToUiQueue = SPSCRingBuffer(capacity=16384, coalesceKey=_uiCoalesceKey)
+uiToScannerQueue = SPSCRingBuffer(capacity=1024)
+
+
+# Decoded and scaled button images by (file name, size), see _getButtonBitmap()
+_buttonBitmaps: Dict[Tuple[str, int], wx.Bitmap] = {}
+
+
+def _getButtonBitmap(imgName: str, size: int) -> wx.Bitmap:
+    """
+    Load a square button image from img/ once per size - needs the wx.App, so can't be done at import
+    """
+    key = (imgName, size)
+    bitmap = _buttonBitmaps.get(key)
+    if bitmap is None:
+        image = wx.Image(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img', imgName), wx.BITMAP_TYPE_ANY)
+        bitmap = wx.Bitmap(image.Scale(size, size, wx.IMAGE_QUALITY_HIGH))
+        _buttonBitmaps[key] = bitmap
+    return bitmap
+
+
+# RSSI / noise floor label text by rounded dBFS - shared by every strip, the range of values is small
+_rssiLabels: Dict[int, str] = {}
+_noiseFloorLabels: Dict[int, str] = {}
+
+
+def _getRssiLabel(dBFS: int) -> str:
+    label = _rssiLabels.get(dBFS)
+    if label is None:
+        label = _rssiLabels[dBFS] = f"{dBFS:4d} dBFS"
+    return label
+
+
+def _getNoiseFloorLabel(dBFS: int) -> str:
+    label = _noiseFloorLabels.get(dBFS)
+    if label is None:
+        label = _noiseFloorLabels[dBFS] = f"Noise: {dBFS:4d} dBFS"
+    return label
 
 
 class StoppableThread(threading.Thread):
@@ -35,7 +92,7 @@ class StoppableThread(threading.Thread):
 
 class ScannerControlThread(StoppableThread):
 
-    def __init__(self, scanner: Scanner, processScannerDataFn, *args, **kwargs):
+    def __init__(self, scanner: Scanner, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         ###
@@ -43,24 +100,30 @@ class ScannerControlThread(StoppableThread):
 
         self.scanner = scanner
 
-        self._parent_processScannerDataFn = processScannerDataFn
-
+        # No per-message callback into the UI thread - the MainFrame's UI update timer drains scannerToUiQueue
         self.scanner.addInputQueue(uiToScannerQueue)
         self.scanner.addOutputQueue(scannerToUiQueue)
-        self.scanner.addProcessQueueCallback(self.processScannerDataCb)
 
     def run(self) -> None:
         self.scanner.runReceiverProcesses()
         super().stop()
 
     def stop(self) -> None:
+        super().stop()
+        # Stop through the input queue, so the Scanner ends its current command batch on it
+        try:
+            uiToScannerQueue.put_nowait({
+                'type': 'ScannerStop',
+            })
+        except queue.Full:
+            pass
         self.scanner.stop()
-
-    def processScannerDataCb(self) -> None:
-        wx.CallAfter(self._parent_processScannerDataFn)
         
 
 class BasePanelManager():
+    # Subclasses built per channel declare their own __slots__, the rest get a __dict__ as usual
+    __slots__ = ('parentPanel', 'panel')
+
     def __init__(self, parentPanel):
         self.parentPanel = parentPanel
         self.panel = wx.Panel(parentPanel)
@@ -80,9 +143,61 @@ class RSSIDisplayPanelManager(BasePanelManager):
     VOLUME_PANEL_WIDTH = NOISEFLOOR_LABEL_WIDTH
     VOLUME_PANEL_HEIGHT = 10
 
+    # One per channel strip, and the attributes are read on every status update
+    __slots__ = (
+        '_channelSelectCb', 'meterPanel', 'stLabel', 'stNoiseFloor', 'volumePanel',
+        '_volumeClientWidth', '_volumeClientHeight',
+        'rssi_dBFS', 'rssiOverThreshold', 'noiseFloor_dBFS', '_volume_dBFS',
+        '_lastRssiInt', '_lastNoiseInt', '_lastBars', '_volumeFillWidth', '_meterDirtyRect', '_volumeDirtyRect',
+    )
+
+    # RSSI bar rectangles (x, y, width, height), filled when rssiOverThreshold exceeds _BAR_THRESHOLDS
+    _BAR_THRESHOLDS = (0, 10, 20, 30)
+    _BAR_COORDS = [
+        (0, BAR_HEIGHT_STEP * 4, BAR_WIDTH, BAR_HEIGHT_STEP),
+        ((BAR_WIDTH + BAR_SPACING), BAR_HEIGHT_STEP * 3, BAR_WIDTH, BAR_HEIGHT_STEP * 2),
+        ((BAR_WIDTH + BAR_SPACING) * 2, BAR_HEIGHT_STEP * 2, BAR_WIDTH, BAR_HEIGHT_STEP * 3),
+        ((BAR_WIDTH + BAR_SPACING) * 3, BAR_HEIGHT_STEP, BAR_WIDTH, BAR_HEIGHT_STEP * 4),
+    ]
+
+    # Pens / Brushes shared by every paint, see _initGdiObjects()
+    _PEN_BLACK: Optional[wx.Pen] = None
+    _PEN_BLACK_0: Optional[wx.Pen] = None
+    _BRUSH_BLACK_SOLID: Optional[wx.Brush] = None
+    _BRUSH_BLACK_TRANSPARENT: Optional[wx.Brush] = None
+    _BRUSH_GREEN: Optional[wx.Brush] = None
+    # Font of the RSSI / noise floor text, shared by every strip - see _initFont()
+    _FONT_SMALL: Optional[wx.Font] = None
+
+    @classmethod
+    def _initGdiObjects(cls):
+        """
+        Create the Pens / Brushes once - needs the wx.App, so can't be done at class scope
+        """
+        if cls._PEN_BLACK is not None:
+            return
+        cls._PEN_BLACK = wx.Pen('black', 1, wx.SOLID)
+        cls._PEN_BLACK_0 = wx.Pen('black', 0, wx.SOLID)
+        cls._BRUSH_BLACK_SOLID = wx.Brush('black', wx.SOLID)
+        cls._BRUSH_BLACK_TRANSPARENT = wx.Brush('black', wx.BRUSHSTYLE_TRANSPARENT)
+        cls._BRUSH_GREEN = wx.Brush('green', wx.SOLID)
+
+    @classmethod
+    def _initFont(cls, control: wx.Window):
+        """
+        Derive the small font from the first text control's default font, once
+        """
+        if cls._FONT_SMALL is not None:
+            return
+        font = control.GetFont()
+        font.PointSize -= 2
+        cls._FONT_SMALL = font
+
     def __init__(self, parentPanel, channelSelectCb):
         super().__init__(parentPanel)
 
+        self._initGdiObjects()
+
         self._channelSelectCb = channelSelectCb
 
         sizer = wx.BoxSizer(wx.VERTICAL)
@@ -96,14 +211,16 @@ class RSSIDisplayPanelManager(BasePanelManager):
         self.meterPanel = wx.Panel(self.panel, size=(meterPanelWidth, self.BAR_HEIGHT_STEP * 5))
         rssiSizer.Add(self.meterPanel, 0, wx.FIXED_MINSIZE | wx.ALL, 2)
 
+        # Fixed size, so a new value doesn't resize the text and re-layout the strip - see also setRSSI()
         self.stLabel = wx.StaticText(
             self.panel,
             label="",
-            size=(self.LABEL_WIDTH, -1)
+            size=(self.LABEL_WIDTH, -1),
+            style=wx.ST_NO_AUTORESIZE
         )
-        font = self.stLabel.GetFont()
-        font.PointSize -= 2
-        self.stLabel.SetFont(font)
+        self._initFont(self.stLabel)
+        self.stLabel.SetFont(self._FONT_SMALL)
+        self.stLabel.SetInitialSize((self.LABEL_WIDTH, -1))
         rssiSizer.Add(self.stLabel, 0, wx.ALIGN_BOTTOM, 0)
 
         sizer.Add(rssiSizer, 0, 0, 0)
@@ -114,17 +231,19 @@ class RSSIDisplayPanelManager(BasePanelManager):
         self.stNoiseFloor = wx.StaticText(
             self.panel,
             label="",
-            size=(self.NOISEFLOOR_LABEL_WIDTH, -1)
+            size=(self.NOISEFLOOR_LABEL_WIDTH, -1),
+            style=wx.ST_NO_AUTORESIZE
         )
-        font = self.stNoiseFloor.GetFont()
-        font.PointSize -= 2
-        self.stNoiseFloor.SetFont(font)
+        self.stNoiseFloor.SetFont(self._FONT_SMALL)
+        self.stNoiseFloor.SetInitialSize((self.NOISEFLOOR_LABEL_WIDTH, -1))
         sizer.Add(self.stNoiseFloor, 0, 0, 0)
 
         ###
         # Volume Bar
 
-        self.volumePanel = wx.Panel(self.panel, size=(self.VOLUME_PANEL_WIDTH, self.VOLUME_PANEL_HEIGHT))
+        # The native border replaces drawing one on every paint
+        self.volumePanel = wx.Panel(self.panel, style=wx.SIMPLE_BORDER, size=(self.VOLUME_PANEL_WIDTH, self.VOLUME_PANEL_HEIGHT))
+        self._volumeClientWidth, self._volumeClientHeight = self.volumePanel.GetClientSize()
         sizer.Add(self.volumePanel, 0, wx.FIXED_MINSIZE | wx.ALL, 2)
 
 
@@ -140,75 +259,166 @@ class RSSIDisplayPanelManager(BasePanelManager):
         self.meterPanel.Bind(wx.EVT_PAINT, self.OnPaintRSSI)
         self.volumePanel.Bind(wx.EVT_PAINT, self.OnPaintVolume)
 
+        # The paint handlers clear the whole panel themselves, so skip the separate erase. AutoBufferedPaintDC only
+        # adds its own back buffer where the platform doesn't already double buffer the window.
+        for panel in (self.meterPanel, self.volumePanel):
+            panel.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+
         self.rssi_dBFS: Optional[float] = None
         self.rssiOverThreshold: Optional[float] = None
         self.noiseFloor_dBFS: Optional[float] = None
         self._volume_dBFS: Optional[float] = -999.9
 
+        # What's currently displayed, so unchanged labels / bars aren't set again
+        self._lastRssiInt: Optional[int] = None
+        self._lastNoiseInt: Optional[int] = None
+        self._lastBars: Optional[int] = None
+        self._volumeFillWidth = 0  # pixels, drawn by OnPaintVolume
+
+        # Areas changed since the last refreshDirty()
+        self._meterDirtyRect: Optional[wx.Rect] = None
+        self._volumeDirtyRect: Optional[wx.Rect] = None
+
     def onMouseDown(self, event):
         self._channelSelectCb()
         event.Skip()
 
-    def OnPaintRSSI(self, event):
-        # Create a Device Context (DC) for painting the panel
-        dc = wx.PaintDC(self.meterPanel)
+    def resetDisplay(self):
+        """
+        Back to the blank state of a new panel, for reuse with another channel
+        """
+        self.rssi_dBFS = None
+        self.rssiOverThreshold = None
+        self.noiseFloor_dBFS = None
+        self._volume_dBFS = -999.9
+        self._lastRssiInt = None
+        self._lastNoiseInt = None
+        self._lastBars = None
+        self._volumeFillWidth = 0
+        self._meterDirtyRect = None
+        self._volumeDirtyRect = None
+        self.stLabel.SetLabel('')
+        self.stNoiseFloor.SetLabel('')
+        self.meterPanel.Refresh()
+        self.volumePanel.Refresh()
 
-        dc.SetPen(wx.Pen('black', 1, wx.SOLID))
+    def _clearDC(self, dc: wx.DC, panel: wx.Panel):
+        dc.SetBackground(wx.TheBrushList.FindOrCreateBrush(panel.GetBackgroundColour(), wx.BRUSHSTYLE_SOLID))
+        dc.Clear()
 
-        i = 0
-        for db in [0, 10, 20, 30]:
-            if self.rssiOverThreshold is not None and self.rssiOverThreshold > db:
-                dc.SetBrush(wx.Brush('black', wx.SOLID))
-            else:
-                dc.SetBrush(wx.Brush('black', wx.BRUSHSTYLE_TRANSPARENT))
+    def OnPaintRSSI(self, event):
+        # Create a buffered Device Context (DC) for painting the panel
+        dc = wx.AutoBufferedPaintDC(self.meterPanel)
+        self._clearDC(dc, self.meterPanel)
 
-            x1 = (self.BAR_WIDTH + self.BAR_SPACING) * i
-            x2 = self.BAR_WIDTH
-            y1 = self.BAR_HEIGHT_STEP * (4-i)
-            y2 = self.BAR_HEIGHT_STEP * (i+1)
-            dc.DrawRectangle(x1, y1, x2, y2)
+        dc.SetPen(self._PEN_BLACK)
 
-            i += 1
+        # Filled bars, then the outlines of the rest. A list of brushes makes DrawRectangleList select a brush for
+        # every rect, so two lists with one brush each are cheaper even though partly filled meters take two calls.
+        # The number filled is tracked by setRSSI()
+        bars = self._lastBars or 0
+        if bars:
+            dc.DrawRectangleList(self._BAR_COORDS[:bars], None, self._BRUSH_BLACK_SOLID)
+        if bars < len(self._BAR_COORDS):
+            dc.DrawRectangleList(self._BAR_COORDS[bars:], None, self._BRUSH_BLACK_TRANSPARENT)
 
     def OnPaintVolume(self, event):
-        # Create a Device Context (DC) for painting the panel
-        dc = wx.PaintDC(self.volumePanel)
-
-        # draw border
-        dc.SetPen(wx.Pen('black', 1, wx.SOLID))
-        dc.SetBrush(wx.Brush('black', wx.BRUSHSTYLE_TRANSPARENT))
-        x1 = 0
-        y1 = 0
-        x2 =self.VOLUME_PANEL_WIDTH
-        y2 = self.VOLUME_PANEL_HEIGHT
-        dc.DrawRectangle(x1, y1, x2, y2)
-        
-        # draw volume
-        minVal = -50
-        maxVal = 0
-        if self._volume_dBFS is not None and self._volume_dBFS > minVal:
-            dc.SetPen(wx.Pen('black', 0, wx.SOLID))
-            dc.SetBrush(wx.Brush('green', wx.SOLID))
-            if self._volume_dBFS >= maxVal:
-                x2 = self.VOLUME_PANEL_WIDTH
-            else:
-                x2 = int(self.VOLUME_PANEL_WIDTH * ((self._volume_dBFS - minVal) / (maxVal - minVal)))
-            dc.DrawRectangle(x1, y1, x2, y2)
+        # Create a buffered Device Context (DC) for painting the panel
+        dc = wx.AutoBufferedPaintDC(self.volumePanel)
+        self._clearDC(dc, self.volumePanel)
+
+        # draw volume - the border is the panel's own, inside it is the client area
+        if self._volumeFillWidth > 0:
+            dc.SetPen(self._PEN_BLACK_0)
+            dc.SetBrush(self._BRUSH_GREEN)
+            dc.DrawRectangle(0, 0, self._volumeFillWidth, self._volumeClientHeight)
 
-    def setRSSI(self, rssi: float, rssiOverThreshold: float, noiseFloor: Optional[float]):
+    def setRSSI(self, rssi: float, rssiOverThreshold: float, noiseFloor: Optional[float], refresh: bool=True) -> bool:
+        """
+        Returns True if meterPanel needs repainting - the bars only change when a 10 dB step is crossed
+
+        refresh
+            False if the caller will call refreshDirty() itself, e.g. once per batch of updates
+        """
         self.rssi_dBFS = rssi
         self.rssiOverThreshold = rssiOverThreshold
         self.noiseFloor_dBFS = noiseFloor
-        self.stLabel.SetLabel(f"{self.rssi_dBFS:4.0f} dBFS")
-        if noiseFloor is None:
-            self.stNoiseFloor.SetLabel('')
+
+        rssiInt = int(round(rssi))
+        if rssiInt != self._lastRssiInt:
+            self._lastRssiInt = rssiInt
+            self.stLabel.SetLabel(_getRssiLabel(rssiInt))
+
+        noiseInt = None if noiseFloor is None else int(round(noiseFloor))
+        if noiseInt != self._lastNoiseInt:
+            self._lastNoiseInt = noiseInt
+            if noiseInt is None:
+                self.stNoiseFloor.SetLabel('')
+            else:
+                self.stNoiseFloor.SetLabel(_getNoiseFloorLabel(noiseInt))
+
+        # Number of filled bars drawn by OnPaintRSSI - thresholds strictly exceeded, in one call
+        bars = bisect.bisect_left(self._BAR_THRESHOLDS, rssiOverThreshold)
+        lastBars = self._lastBars
+        if bars == lastBars:
+            return False
+        self._lastBars = bars
+
+        if lastBars is None:
+            # Nothing drawn from a value yet
+            dirty = wx.Rect(self.meterPanel.GetClientSize())
         else:
-            self.stNoiseFloor.SetLabel(f"Noise: {self.noiseFloor_dBFS:4.0f} dBFS")
-        self.meterPanel.Refresh()
+            # Only the bars that went from filled to empty or back
+            dirty = wx.Rect(*self._BAR_COORDS[min(bars, lastBars)]).Union(
+                wx.Rect(*self._BAR_COORDS[max(bars, lastBars) - 1])
+            )
+        self._meterDirtyRect = dirty if self._meterDirtyRect is None else self._meterDirtyRect.Union(dirty)
+
+        if refresh:
+            self.refreshDirty()
+        return True
 
-    def setVolume(self, volume_dBFS: Optional[float]):
+    def setVolume(self, volume_dBFS: Optional[float], refresh: bool=True) -> bool:
+        """
+        Returns True if volumePanel needs repainting - only when the bar changes by a whole pixel
+
+        refresh
+            False if the caller will call refreshDirty() itself, e.g. once per batch of updates
+        """
         self._volume_dBFS = volume_dBFS
-        self.volumePanel.Refresh()
+
+        minVal = -50
+        maxVal = 0
+        if volume_dBFS is None or volume_dBFS <= minVal:
+            fillWidth = 0
+        elif volume_dBFS >= maxVal:
+            fillWidth = self._volumeClientWidth
+        else:
+            fillWidth = int(self._volumeClientWidth * ((volume_dBFS - minVal) / (maxVal - minVal)))
+
+        lastFillWidth = self._volumeFillWidth
+        if fillWidth == lastFillWidth:
+            return False
+        self._volumeFillWidth = fillWidth
+
+        # Only the strip between the old and new end of the bar
+        dirty = wx.Rect(min(fillWidth, lastFillWidth), 0, abs(fillWidth - lastFillWidth) + 1, self._volumeClientHeight)
+        self._volumeDirtyRect = dirty if self._volumeDirtyRect is None else self._volumeDirtyRect.Union(dirty)
+
+        if refresh:
+            self.refreshDirty()
+        return True
+
+    def refreshDirty(self):
+        """
+        Invalidate only what setRSSI() / setVolume() changed since the last call
+        """
+        if self._meterDirtyRect is not None:
+            self.meterPanel.RefreshRect(self._meterDirtyRect, eraseBackground=False)
+            self._meterDirtyRect = None
+        if self._volumeDirtyRect is not None:
+            self.volumePanel.RefreshRect(self._volumeDirtyRect, eraseBackground=False)
+            self._volumeDirtyRect = None
 
 
 class ChannelStripPanelManager(BasePanelManager):
@@ -219,9 +429,47 @@ class ChannelStripPanelManager(BasePanelManager):
 
     DISPLAY_TIMEOUT_S = 15
 
-    def __init__(self, parentPanel, channelConfig: ChannelConfig, channelSelectCb):
+    __slots__ = (
+        '_channelSelectCb', '_layoutCb', 'channelConfig', 'stLabel', 'stFreq', 'rssiPM',
+        '_defaultBgColour', '_lastBgColour', '_lastActive', '_lastStatus', '_isHidden', '_hideTimer',
+    )
+
+    # Background colour per status, built once - RGB, the colour database isn't available before the wx.App
+    _BG_IDLE = wx.Colour(192, 192, 192)
+    _BG_ACTIVE = wx.Colour(0, 192, 0)
+    _BG_DWELL = wx.Colour(192, 192, 0)
+    _BG_HOLD = wx.Colour(192, 192, 0)
+    _BG_FORCE_ACTIVE = wx.Colour(224, 96, 96)
+    # Statuses other than IDLE, all of which count as the channel being active
+    _STATUS_BG = {
+        ChannelStatus.ACTIVE: _BG_ACTIVE,
+        ChannelStatus.DWELL: _BG_DWELL,
+        ChannelStatus.HOLD: _BG_HOLD,
+        ChannelStatus.FORCE_ACTIVE: _BG_FORCE_ACTIVE,
+    }
+
+    # Font of the channel label, shared by every strip - see _initFont()
+    _FONT_LABEL: Optional[wx.Font] = None
+
+    @classmethod
+    def _initFont(cls, control: wx.Window):
+        """
+        Derive the label font from the first label's default font, once
+        """
+        if cls._FONT_LABEL is not None:
+            return
+        font = control.GetFont()
+        font.PointSize += 4
+        cls._FONT_LABEL = font.Bold()
+
+    def __init__(self, parentPanel, channelConfig: ChannelConfig, channelSelectCb, layoutCb: Optional[Callable[[], None]]=None):
+        """
+        layoutCb
+            Called instead of parentPanel.Layout() when the strip is shown / hidden, to lay out many at once
+        """
         super().__init__(parentPanel)
         self._channelSelectCb = channelSelectCb
+        self._layoutCb = layoutCb
 
         sizer = wx.BoxSizer(wx.HORIZONTAL)
 
@@ -231,103 +479,207 @@ class ChannelStripPanelManager(BasePanelManager):
         # Label
         labelSizer = wx.BoxSizer(wx.VERTICAL)
 
-        stLabel = wx.StaticText(
+        self.stLabel = wx.StaticText(
             self.panel,
             label=f"{channelConfig.label}",
             size=(self.LABEL_WIDTH, -1)
         )
-        font = stLabel.GetFont()
-        font.PointSize += 4
-        font = font.Bold()
-        stLabel.SetFont(font)
-        labelSizer.Add(stLabel, 0, wx.ALL, 2)
+        self._initFont(self.stLabel)
+        self.stLabel.SetFont(self._FONT_LABEL)
+        labelSizer.Add(self.stLabel, 0, wx.ALL, 2)
 
         # Freq
-        stFreq = wx.StaticText(
+        self.stFreq = wx.StaticText(
             self.panel,
-            label=f"{channelConfig.freq_hz / 1e6:6.3f}",
+            label=channelConfig.getFreqLabel(),
             size=(self.FREQ_WIDTH, -1)
         )
-        labelSizer.Add(stFreq, 0, wx.BOTTOM, 2)
+        labelSizer.Add(self.stFreq, 0, wx.BOTTOM, 2)
 
         sizer.Add(labelSizer, 0, 0, 0)
 
         # RSSI
-        self.rssiPM = RSSIDisplayPanelManager(self.panel, partial(self._channelSelectCb, channelConfig.id))
+        self.rssiPM = RSSIDisplayPanelManager(self.panel, self.onRssiSelect)
         sizer.Add(self.rssiPM.getPanel(), 0, wx.RESERVE_SPACE_EVEN_IF_HIDDEN, 0)
 
         # Mouse Click
         self.panel.Bind(wx.EVT_LEFT_DOWN, self.onMouseDown)
-        stLabel.Bind(wx.EVT_LEFT_DOWN, self.onMouseDown)
-        stFreq.Bind(wx.EVT_LEFT_DOWN, self.onMouseDown)
+        self.stLabel.Bind(wx.EVT_LEFT_DOWN, self.onMouseDown)
+        self.stFreq.Bind(wx.EVT_LEFT_DOWN, self.onMouseDown)
         self.rssiPM.getPanel().Bind(wx.EVT_LEFT_DOWN, self.onMouseDown)
 
         self.panel.SetSizer(sizer)
 
+        self._defaultBgColour = self.panel.GetBackgroundColour()
+        self._lastBgColour = self._defaultBgColour
         self._lastActive = 0.0
         self._lastStatus: Optional[ChannelStatus] = None
         self._isHidden = False
 
+        # Pending while the strip is shown, to hide it once it times out - see _scheduleHide()
+        self._hideTimer: Optional[wx.CallLater] = None
+        self._scheduleHide()
+
     def onMouseDown(self, event: wx.MouseEvent):
         self._channelSelectCb(self.channelConfig.id)
         event.Skip()
 
-    def setRSSI(self, rssi: float, noiseFloor: Optional[float]):
-        rssiOverThreshold = rssi - self.channelConfig.squelchThreshold
-        self.rssiPM.setRSSI(rssi, rssiOverThreshold, noiseFloor)
-
-    def setVolume(self, volume_dBFS: float):
-        self.rssiPM.setVolume(volume_dBFS)
-
-    def setChannelStatus(self, status: ChannelStatus):
-        bgColor = wx.Colour(192, 192, 192)  # IDLE
-
-        if status == ChannelStatus.ACTIVE:
-            self._lastActive = time.time()
-            bgColor = wx.Colour(0, 192, 0)
-        elif status == ChannelStatus.DWELL:
-            self._lastActive = time.time()
-            bgColor = wx.Colour(192, 192, 0)
-        elif status == ChannelStatus.HOLD:
-            self._lastActive = time.time()
-            bgColor = wx.Colour(192, 192, 0)
-        elif status == ChannelStatus.FORCE_ACTIVE:
-            self._lastActive = time.time()
-            bgColor = wx.Colour(224, 96, 96)
-
-        if status != self._lastStatus:
-            self.panel.SetBackgroundColour(bgColor)
-            self._lastStatus = status
+    def onRssiSelect(self):
+        # Looked up on click, the strip may have been reassigned to another channel since it was built
+        self._channelSelectCb(self.channelConfig.id)
+
+    def setRSSI(self, rssi: float, rssiOverThreshold: float, noiseFloor: Optional[float], refresh: bool=True) -> bool:
+        """
+        Returns True if the RSSI meter needs repainting
+        """
+        return self.rssiPM.setRSSI(rssi, rssiOverThreshold, noiseFloor, refresh)
+
+    def setVolume(self, volume_dBFS: float, refresh: bool=True) -> bool:
+        """
+        Returns True if the volume bar needs repainting
+        """
+        return self.rssiPM.setVolume(volume_dBFS, refresh)
+
+    def setChannelStatus(self, status: ChannelStatus, now: float, layout: bool=True) -> bool:
+        """
+        Returns True if the strip was shown / hidden
+
+        now
+            time.monotonic(), read once by the caller for a batch of updates
+        layout
+            False if the caller will Layout() the parentPanel itself, e.g. once for many strips
+        """
+        if status != ChannelStatus.IDLE:
+            self._lastActive = now
+
+        # Repeats of the same status are the common case, only transitions touch the panel
+        if status == self._lastStatus:
+            return False
+
+        self._lastStatus = status
+        # DWELL and HOLD share a colour - no repaint when only the status changes
+        bgColour = self._STATUS_BG.get(status, self._BG_IDLE)
+        if bgColour != self._lastBgColour:
+            self._lastBgColour = bgColour
+            self.panel.SetBackgroundColour(bgColour)
             self.panel.Refresh()
-            self.updateHiddenStatus()
+        return self.updateHiddenStatus(layout, now)
 
     def channelConfigUpdated(self):
         self.panel.Refresh()
         self.updateHiddenStatus()
 
-    def updateHiddenStatus(self):
-        shouldHide = time.time() - self._lastActive > self.DISPLAY_TIMEOUT_S
-        if shouldHide != self._isHidden:
-            self._isHidden = shouldHide
-            if shouldHide:
-                self.panel.Hide()
+    def updateConfig(self, channelConfig: ChannelConfig):
+        """
+        Reuse this strip for a reloaded ChannelConfig with the same id
+        """
+        self.channelConfig = channelConfig
+        label = f"{channelConfig.label}"
+        if self.stLabel.GetLabel() != label:
+            self.stLabel.SetLabel(label)
+        freqLabel = channelConfig.getFreqLabel()
+        if self.stFreq.GetLabel() != freqLabel:
+            self.stFreq.SetLabel(freqLabel)
+        # Called for many strips at once from ActiveChannelPanelManager.resetConfig, which does the Layout()
+        self.panel.Refresh()
+        self.updateHiddenStatus(layout=False)
+
+    def assignChannel(self, channelConfig: ChannelConfig):
+        """
+        Reuse a pooled strip for a different channel, starting from the state of a newly built strip
+        """
+        self.rssiPM.resetDisplay()
+        self._lastActive = 0.0
+        self._lastStatus = None
+        self._isHidden = False
+        self.panel.SetBackgroundColour(self._defaultBgColour)
+        self._lastBgColour = self._defaultBgColour
+        self.panel.Show()
+        self.updateConfig(channelConfig)
+        self._scheduleHide()
+
+    def release(self):
+        """
+        Hide the strip and stop its timer, while it waits in the pool for another channel
+        """
+        if self._hideTimer is not None:
+            self._hideTimer.Stop()
+        self._isHidden = True
+        self.panel.Hide()
+
+    def isHidden(self) -> bool:
+        return self._isHidden
+
+    def getLastActive(self) -> float:
+        return self._lastActive
+
+    def updateHiddenStatus(self, layout: bool=True, now: Optional[float]=None) -> bool:
+        """
+        Returns True if the strip was shown / hidden
+
+        layout
+            False if the caller will Layout() the parentPanel itself, e.g. once for many strips
+        now
+            time.monotonic() if the caller already has it
+        """
+        if now is None:
+            now = time.monotonic()
+        shouldHide = now - self._lastActive > self.DISPLAY_TIMEOUT_S
+        if shouldHide == self._isHidden:
+            return False
+
+        self._isHidden = shouldHide
+        if shouldHide:
+            self.panel.Hide()
+        else:
+            self.panel.Show()
+            self._scheduleHide(now)
+        if layout:
+            if self._layoutCb is not None:
+                self._layoutCb()
             else:
-                self.panel.Show()
-            self.parentPanel.Layout()
+                self.parentPanel.Layout()
+        return True
 
-    def runMaintenance(self):
+    def _scheduleHide(self, now: Optional[float]=None):
         """
-        Called periodically to see if the channel should be timed out and hidden
+        Make sure a timer is pending for when the strip would time out, if nothing is active before then.
+
+        One timer per shown strip rather than a periodic sweep of every strip - statuses only move _lastActive
+        on, the timer checks again when it fires.
         """
+        if self._hideTimer is not None and self._hideTimer.IsRunning():
+            return
+        if now is None:
+            now = time.monotonic()
+        delay_ms = max(1, int((self._lastActive + self.DISPLAY_TIMEOUT_S - now) * 1000) + 1)
+        if self._hideTimer is None:
+            self._hideTimer = wx.CallLater(delay_ms, self._onHideTimer)
+        else:
+            self._hideTimer.Start(delay_ms)
+
+    def _onHideTimer(self):
+        if not self.panel or self._isHidden:  # Destroyed, or released to the pool
+            return
+        now = time.monotonic()
         if self._lastStatus in [ChannelStatus.ACTIVE, ChannelStatus.FORCE_ACTIVE]:
-            self._lastActive = time.time()
-        self.updateHiddenStatus()
+            self._lastActive = now
+        self.updateHiddenStatus(now=now)
+        if not self._isHidden:
+            self._scheduleHide(now)
 
 
 class ActiveChannelPanelManager(BasePanelManager):
     """
     Creates a Panel for displaying and managing the active Channels
+
+    A channel's strip is only built the first time it's active, most channels of a large config never are
     """
+
+    # Once this many strips are built, the strip of the least recently active hidden channel is reassigned instead
+    # of building another - strips that are shown are never taken
+    MAX_STRIPS = 32
+
     def __init__(self, parentPanel, channelConfigs: List[ChannelConfig], channelSelectCb):
         self._channelSelectCb = channelSelectCb
         self.parentPanel = parentPanel
@@ -340,57 +692,170 @@ class ActiveChannelPanelManager(BasePanelManager):
 
         self.channelStripPanelManagersById: Dict[Any, ChannelStripPanelManager] = {}
 
-        self.resetConfig(channelConfigs)
+        # Every configured channel, and its position in the config - the strips are kept in that order
+        self._channelConfigsById: Dict[Any, ChannelConfig] = {}
+        self._channelOrder: Dict[Any, int] = {}
+
+        # RSSIDisplayPanelManagers updated since the last refreshPending() - repainted by the MainFrame's UI update timer
+        self._pendingRefresh = set()
+
+        # Set when setChannelStatus() shows / hides a strip - one Layout() in refreshPending() for all of them
+        self._layoutPending = False
+
+        # Hidden strips of removed channels, reassigned to newly active channels instead of building new widgets
+        self._stripPool: Deque[ChannelStripPanelManager] = deque()
 
+        # Sizer first, so the single Layout() at the end of resetConfig() covers the initial strips
         self.panel.SetSizer(self.sizer)
 
+        self.resetConfig(channelConfigs)
+
     def resetConfig(self, channelConfigs: List[ChannelConfig]):
         """
         Called on init or whenever the Scanner Config changes.
         """
-        # For now do a complete rebuild
-        for cspm in self.channelStripPanelManagersById.values():
-            cspm.getPanel().Destroy()
-        self.channelStripPanelManagersById = {}
-
+        # No repaints while strips are built / reassigned and re-added, the one Layout() at the end places them
+        self.panel.Freeze()
+        try:
+            self._resetStrips(channelConfigs)
+        finally:
+            self.panel.Thaw()
+
+    def _resetStrips(self, channelConfigs: List[ChannelConfig]):
+        self._channelConfigsById = { cc.id: cc for cc in channelConfigs }
+        self._channelOrder = { cc.id: i for i, cc in enumerate(channelConfigs) }
+
+        # Reuse the strips of channels that are still present, and pool the strips of removed channels - strips of
+        # new channels are built by setChannelStatus() once they're active
+        oldById = self.channelStripPanelManagersById
+        removedIds = oldById.keys() - self._channelConfigsById.keys()
+        for channelId in removedIds:
+            cspm = oldById.pop(channelId)
+            self._pendingRefresh.discard(cspm.rssiPM)
+            cspm.release()
+            self._stripPool.append(cspm)
+
+        newById: Dict[Any, ChannelStripPanelManager] = {}
         for cc in channelConfigs:
-            cspm = ChannelStripPanelManager(self.panel, cc, self._channelSelectCb)
-            self.channelStripPanelManagersById[cc.id] = cspm
+            cspm = oldById.get(cc.id)
+            if cspm is not None:
+                cspm.updateConfig(cc)
+                newById[cc.id] = cspm
+        self.channelStripPanelManagersById = newById
+
+        # Re-add in the new order, without deleting the reused windows
+        self.sizer.Clear(delete_windows=False)
+        for cspm in newById.values():
             self.sizer.Add(cspm.getPanel(), 0, 0, 0)
 
+        self._layoutPending = False
         self.panel.Layout()
 
-    def setChannelRSSI(self, channelId, rssi: float, noiseFloor: Optional[float]):
-        cspm = self.channelStripPanelManagersById.get(channelId)
-        if not cspm:
-            print("*** CHANNEL NOT FOUND - ActiveChannelPanelManager")
-            return
-        cspm.setRSSI(rssi, noiseFloor)
+    def setChannelStatus(self, update: ChannelStatusUpdate, now: Optional[float]=None):
+        """
+        Apply a coalesced ChannelStatus - volume, RSSI if reported, and status - with one lookup of the strip
 
-    def setChannelVolume(self, channelId, volume_dBFS: float):
-        cspm = self.channelStripPanelManagersById.get(channelId)
-        if not cspm:
-            print("*** CHANNEL NOT FOUND - ActiveChannelPanelManager")
+        now
+            time.monotonic(), if the caller reads it once for a batch of updates
+        """
+        channelId, status, rssi, rssiOverThreshold, noiseFloor, volume_dBFS = update
+        try:
+            cspm = self.channelStripPanelManagersById[channelId]
+        except KeyError:
+            if status == ChannelStatus.IDLE and channelId in self._channelConfigsById:
+                # Never active yet, nothing to display
+                return
+            cspm = self._addStrip(channelId)
+            if cspm is None:
+                print(f"*** CHANNEL NOT FOUND - ActiveChannelPanelManager: {channelId}")
+                return
+
+        # Status first, it can show the strip
+        if cspm.setChannelStatus(status, time.monotonic() if now is None else now, layout=False):
+            self._layoutPending = True
+
+        # Nothing to draw for a hidden strip - what's displayed is tracked, so the next update once shown repaints
+        if cspm.isHidden():
             return
-        cspm.setVolume(volume_dBFS)
 
-    def setChannelStatus(self, channelId, status: ChannelStatus):
-        cspm = self.channelStripPanelManagersById.get(channelId)
-        if not cspm:
-            print("*** CHANNEL NOT FOUND - ActiveChannelPanelManager")
-            return
-        cspm.setChannelStatus(status)
+        if cspm.setVolume(volume_dBFS, refresh=False):
+            self._pendingRefresh.add(cspm.rssiPM)
+
+        if rssi is not None and cspm.setRSSI(rssi, rssiOverThreshold, noiseFloor, refresh=False):
+            self._pendingRefresh.add(cspm.rssiPM)
+
+    def _addStrip(self, channelId) -> Optional[ChannelStripPanelManager]:
+        """
+        Give a channel that has just become active a strip, in its config position. Returns None for an unknown
+        channel. The caller does the Layout(), see refreshPending()
+        """
+        cc = self._channelConfigsById.get(channelId)
+        if cc is None:
+            return None
+
+        stripsById = self.channelStripPanelManagersById
+        reclaimId = None
+        if not self._stripPool and len(stripsById) >= self.MAX_STRIPS:
+            reclaimId = self._leastRecentlyActiveHiddenId()
+
+        if self._stripPool:
+            cspm = self._stripPool.popleft()
+            cspm.assignChannel(cc)
+        elif reclaimId is not None:
+            cspm = stripsById.pop(reclaimId)
+            self._pendingRefresh.discard(cspm.rssiPM)
+            self.sizer.Detach(cspm.getPanel())
+            cspm.assignChannel(cc)
+        else:
+            cspm = ChannelStripPanelManager(self.panel, cc, self._channelSelectCb, self.requestLayout)
+
+        # Strips are few, counting the ones before this channel is cheaper than keeping a sorted structure
+        order = self._channelOrder
+        position = order[channelId]
+        index = sum(1 for otherId in stripsById if order[otherId] < position)
+        self.sizer.Insert(index, cspm.getPanel(), 0, 0, 0)
+        stripsById[channelId] = cspm
+        self._layoutPending = True
+        return cspm
+
+    def _leastRecentlyActiveHiddenId(self):
+        """
+        Returns None if every strip is shown
+        """
+        reclaimId = None
+        oldestActive = None
+        for channelId, cspm in self.channelStripPanelManagersById.items():
+            if cspm.isHidden() and (oldestActive is None or cspm.getLastActive() < oldestActive):
+                reclaimId = channelId
+                oldestActive = cspm.getLastActive()
+        return reclaimId
 
     def channelConfigUpdated(self, channelId):
         cspm = self.channelStripPanelManagersById.get(channelId)
         if not cspm:
-            print("*** CHANNEL NOT FOUND - ActiveChannelPanelManager")
+            if channelId not in self._channelConfigsById:
+                print("*** CHANNEL NOT FOUND - ActiveChannelPanelManager")
             return
         cspm.channelConfigUpdated()
 
-    def runMaintenance(self):
-        for cspm in self.channelStripPanelManagersById.values():
-            cspm.runMaintenance()
+    def requestLayout(self):
+        """
+        Layout() in the next refreshPending(), with any other strips shown / hidden by then - e.g. several hide timers
+        firing together
+        """
+        self._layoutPending = True
+
+    def refreshPending(self):
+        """
+        Refresh the changed areas of each RSSI / volume display updated by setChannelStatus() once, and Layout() if
+        it changed which strips are shown
+        """
+        if self._layoutPending:
+            self._layoutPending = False
+            self.panel.Layout()
+        for rssiPM in self._pendingRefresh:
+            rssiPM.refreshDirty()
+        self._pendingRefresh.clear()
 
 
 class ChannelConfigPanelManager(BasePanelManager):
@@ -401,6 +866,10 @@ class ChannelConfigPanelManager(BasePanelManager):
     CMD_BUTTON_WIDTH = 30
     CMD_BUTTON_HEIGHT = 25
 
+    # Button highlight colours, built once - RGB, the colour database isn't available before the wx.App
+    _BTN_YELLOW = wx.Colour(255, 255, 0)
+    _BTN_RED = wx.Colour(255, 0, 0)
+
     def __init__(self, parentPanel, scanner: Scanner):
         self.parentPanel = parentPanel
         self.panel = wx.Panel(parentPanel)
@@ -484,9 +953,7 @@ class ChannelConfigPanelManager(BasePanelManager):
             label="",
             size=(self.CMD_BUTTON_WIDTH, self.CMD_BUTTON_HEIGHT),
         )
-        playImage = wx.Image(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img/play.png'), wx.BITMAP_TYPE_ANY)
-        playBitmap = wx.Bitmap( playImage.Scale(self.CMD_BUTTON_HEIGHT // 2, self.CMD_BUTTON_HEIGHT // 2, wx.IMAGE_QUALITY_HIGH) ) 
-        self.btnPlay.SetBitmap(playBitmap)
+        self.btnPlay.SetBitmap(_getButtonBitmap('play.png', self.CMD_BUTTON_HEIGHT // 2))
         self.btnPlay.SetToolTip("Force Active")
         self.btnPlay.Bind(wx.EVT_BUTTON, self.onBtnPlay)
         sizer.Add(self.btnPlay, 0, wx.ALL, 2)
@@ -496,14 +963,14 @@ class ChannelConfigPanelManager(BasePanelManager):
             label="",
             size=(self.CMD_BUTTON_WIDTH, self.CMD_BUTTON_HEIGHT),
         )
-        pauseImage = wx.Image(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img/pause.png'), wx.BITMAP_TYPE_ANY)
-        pauseBitmap = wx.Bitmap( pauseImage.Scale(self.CMD_BUTTON_HEIGHT // 2, self.CMD_BUTTON_HEIGHT // 2, wx.IMAGE_QUALITY_HIGH) ) 
-        self.btnPause.SetBitmap(pauseBitmap)
+        self.btnPause.SetBitmap(_getButtonBitmap('pause.png', self.CMD_BUTTON_HEIGHT // 2))
         self.btnPause.SetToolTip("Reset Squelch")
         self.btnPause.Bind(wx.EVT_BUTTON, self.onBtnPause)
         sizer.Add(self.btnPause, 0, wx.ALL, 2)
 
         self._defaultBtnBackgroundColor = self.btnDisable.GetBackgroundColour()
+        # Whether each button currently has its highlight colour, see _setButtonState()
+        self._btnHighlight: Dict[str, bool] = {}
 
         self.panel.SetSizer(sizer)
 
@@ -522,26 +989,39 @@ class ChannelConfigPanelManager(BasePanelManager):
 
     def setChannel(self, channelConfig: ChannelConfig):
         self.channelConfig = channelConfig
-        self.stLabel.SetLabel(channelConfig.label)
-        self.stFreq.SetLabel(f"{channelConfig.freq_hz / 1e6:6.3f}")
-
-        self.btnHold.SetValue(channelConfig.hold)
-        self.btnHold.SetBackgroundColour(wx.Colour('yellow') if channelConfig.hold else self._defaultBtnBackgroundColor)
-
-        self.btnSolo.SetValue(bool(channelConfig.solo))
-        self.btnSolo.SetBackgroundColour(wx.Colour('yellow') if channelConfig.solo else self._defaultBtnBackgroundColor)
-
-        self.btnMute.SetValue(channelConfig.mute)
-        self.btnMute.SetBackgroundColour(wx.Colour('red') if channelConfig.mute else self._defaultBtnBackgroundColor)
-        
-        disabled = not channelConfig.isEnabled()
-        self.btnDisable.SetValue(disabled)
-        self.btnDisable.SetBackgroundColour(wx.Colour('red') if disabled else self._defaultBtnBackgroundColor)
+        # Re-run on every config update of the shown channel - only touch the labels if they changed
+        if self.stLabel.GetLabel() != channelConfig.label:
+            self.stLabel.SetLabel(channelConfig.label)
+        freqLabel = channelConfig.getFreqLabel()
+        if self.stFreq.GetLabel() != freqLabel:
+            self.stFreq.SetLabel(freqLabel)
+
+        changed = False
+        changed |= self._setButtonState(self.btnHold, 'hold', bool(channelConfig.hold), self._BTN_YELLOW)
+        changed |= self._setButtonState(self.btnSolo, 'solo', bool(channelConfig.solo), self._BTN_YELLOW)
+        changed |= self._setButtonState(self.btnMute, 'mute', bool(channelConfig.mute), self._BTN_RED)
+        changed |= self._setButtonState(self.btnDisable, 'disable', not channelConfig.isEnabled(), self._BTN_RED)
+        changed |= self._setButtonState(self.btnPlay, 'forceActive', bool(channelConfig.forceActive), self._BTN_RED, toggle=False)
+
+        if changed:
+            self.panel.Refresh()
 
-        forceActive = channelConfig.forceActive
-        self.btnPlay.SetBackgroundColour(wx.Colour('red') if forceActive else self._defaultBtnBackgroundColor)
+    def _setButtonState(self, btn: wx.AnyButton, key: str, active: bool, colour: wx.Colour, toggle: bool=True) -> bool:
+        """
+        Set a button's toggle value and highlight colour, only touching the native control if they changed.
 
-        self.panel.Refresh()
+        Returns True if anything was changed
+        """
+        changed = False
+        # Compared with the control itself, a click toggles it before the Scanner confirms
+        if toggle and btn.GetValue() != active:
+            btn.SetValue(active)
+            changed = True
+        if self._btnHighlight.get(key) != active:
+            self._btnHighlight[key] = active
+            btn.SetBackgroundColour(colour if active else self._defaultBtnBackgroundColor)
+            changed = True
+        return changed
 
     def onBtnHold(self, event):
         hold = self.btnHold.GetValue()
@@ -685,19 +1165,20 @@ class MainFrame(wx.Frame):
 
         self._scannerControlThread = ScannerControlThread(
             self._scanner,
-            self.processScannerData,
         )
         self._scannerControlThread.start()
 
         ###
-        # Maintenance Timer
+        # UI Update Timer - drains the Scanner messages and repaints the dirty RSSI / volume panels, which bounds
+        # the UI work to one coalesced pass per tick however fast the Scanner sends
 
-        self.maintenanceTimer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.onMaintenanceTimer, self.maintenanceTimer)
-        self.maintenanceTimer.Start(2000) # 2 seconds
+        self.uiUpdateTimer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.onUiUpdateTimer, self.uiUpdateTimer)
+        self.uiUpdateTimer.Start(33) # ~30 Hz
 
-    def onMaintenanceTimer(self, event):
-        self.activeChannelPanelManager.runMaintenance()
+    def onUiUpdateTimer(self, event):
+        self.processScannerData()
+        self.activeChannelPanelManager.refreshPending()
 
     def resetConfig(self):
         self.activeChannelPanelManager.resetConfig(self._scanner.channelConfigs)
@@ -709,19 +1190,60 @@ class MainFrame(wx.Frame):
         self.Layout()
 
     def processScannerData(self):
+        # Only the latest ChannelStatus per channel is displayed - coalesce the drain, and apply what's pending
+        # before any config change so the ordering is kept
+        pendingStatuses: Dict[str, ChannelStatusUpdate] = {}
+        pop = scannerToUiQueue.pop
+        data = pop()
+        while data is not None:
+            if data['type'] == "ChannelStatus":
+                statusData = data["data"]
+                channelId = statusData['id']
+                rssi = statusData.get('rssi')
+                rssiOverThreshold = statusData.get('rssiOverThreshold')
+                noiseFloor = statusData.get('noiseFloor')
+                if rssi is None:
+                    # The RSSI display keeps the last reported value
+                    pending = pendingStatuses.get(channelId)
+                    if pending is not None:
+                        rssi = pending.rssi
+                        rssiOverThreshold = pending.rssiOverThreshold
+                        noiseFloor = pending.noiseFloor
+                pendingStatuses[channelId] = ChannelStatusUpdate(
+                    channelId, statusData['status'], rssi, rssiOverThreshold, noiseFloor, statusData.get('volume'),
+                )
+            elif data['type'] == "ScanWindowConfigsChanged":
+                self.flushChannelStatuses(pendingStatuses)
+                self.resetConfig()
+            elif data['type'] == "ChannelConfig":
+                self.flushChannelStatuses(pendingStatuses)
+                self.channelConfigUpdated(data['data']['id'])
+            data = pop()
+
+        self.flushChannelStatuses(pendingStatuses)
+
+    def flushChannelStatuses(self, pendingStatuses: Dict[str, ChannelStatusUpdate]):
+        """
+        Apply the coalesced ChannelStatus data, with a single batched update of the ConfigDisplay Frame
+        """
+        if not pendingStatuses:
+            return
+
+        configStatuses = {}
+        # Defer the strips' repaints until every update is applied
+        panel = self.activeChannelPanelManager.getPanel()
+        # One clock read for the whole batch
+        now = time.monotonic()
+        panel.Freeze()
         try:
-            while True:
-                data = scannerToUiQueue.get(False)
-                if data['type'] == "ChannelStatus":
-                    self.setChannelStatus(data["data"])
-                elif data['type'] == "ScanWindowConfigsChanged":
-                    self.resetConfig()
-                elif data['type'] == "ChannelConfig":
-                    self.channelConfigUpdated(data['data']['id'])
-
-                scannerToUiQueue.task_done()
-        except queue.Empty:
-            pass
+            for update in pendingStatuses.values():
+                self.setChannelStatus(update, configStatuses, now)
+        finally:
+            panel.Thaw()
+        pendingStatuses.clear()
+
+        if configStatuses and self.configDisplayFrame:
+            self.configDisplayFrame.SetChannelStatuses(configStatuses)
 
     def channelConfigUpdated(self, channelId):
         """
@@ -738,20 +1260,17 @@ class MainFrame(wx.Frame):
         if self.configDisplayFrame:
             self.configDisplayFrame.channelConfigUpdated(channelId)
 
-    def setChannelStatus(self, data):
-        volume_dBFS = data.get('volume')
-        self.activeChannelPanelManager.setChannelVolume(data['id'], volume_dBFS)
+    def setChannelStatus(self, update: ChannelStatusUpdate, configStatuses=None, now: Optional[float]=None):
+        channelId = update.id
+        status = update.status
 
-        rssi = data.get('rssi')
-        noiseFloor = data.get('noiseFloor')
-        if rssi is not None:
-            self.activeChannelPanelManager.setChannelRSSI(data['id'], rssi, noiseFloor)
+        self.activeChannelPanelManager.setChannelStatus(update, now)
 
-        self.activeChannelPanelManager.setChannelStatus(data['id'], data['status'])
-        
-        # Update ConfigDisplay Frame
-        if self.configDisplayFrame:
-            self.configDisplayFrame.SetChannelStatus(data['id'], data['status'])
+        # Update ConfigDisplay Frame - deferred to a single batched update if the caller is collecting
+        if configStatuses is not None:
+            configStatuses[channelId] = status
+        elif self.configDisplayFrame:
+            self.configDisplayFrame.SetChannelStatus(channelId, status)
 
     def channelSelect(self, channelId):
         cc = self._scanner.getChannelById(channelId)
@@ -759,7 +1278,7 @@ class MainFrame(wx.Frame):
             self.channelConfigPanelManager.setChannel(cc)
 
     def onShowConfigFrame(self, event):
-        self.configDisplayFrame = ConfigDisplayFrame(self._scanner, self.channelSelect, None, title="Scanner Config", size=(600,400))
+        self.configDisplayFrame = ConfigDisplayFrame.getInstance(self._scanner, self.channelSelect, None, title="Scanner Config", size=(600,400))
         self.configDisplayFrame.Show()
         self.configDisplayFrame.Raise()
         self.configDisplayFrame.SetFocus()